@@ -1,50 +1,110 @@
 #!/usr/bin/env python3
 
 import argparse
-import copy
+import contextlib
+import functools
+import hashlib
 import html
 import json
 import os
+import queue
 import re
 import shutil
 import sys
 import tempfile
-import urllib.request
+import time
+import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http.cookiejar import MozillaCookieJar
 from sys import exit
-from typing import Dict, List, Tuple, Optional
-from urllib.error import HTTPError
+from typing import Callable, Dict, Iterator, List, Tuple, Optional, Union
 
 import requests
 import ruamel.yaml
-from PIL import Image
 from colorama import Fore, init
 
-import recompiler
-import renamer
-
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0"
+MAX_CONVERSION_WORKERS = 4
+MAX_DOWNLOAD_WORKERS = 8
+MAX_PROBE_WORKERS = 8
+PAGE_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+REQUEST_TIMEOUT = 30  # seconds, for connecting and for each read
+SOURCE_CODE_HOSTS = ("github.com", "gitlab.com")
+SCREENSHOT_EXTENSIONS = (".png", ".jpg", ".jpeg")
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+BR_TAG_PATTERN = re.compile(r"<br\s*/?>")
+SENTENCE_END_PATTERN = re.compile(r"\.\s")
+LANGUAGE_REGION_PATTERN = re.compile(r"-.+")
+# Patterns that are only tested for presence, when they contain none of REGEX_SPECIAL_CHARACTERS they are kept as plain
+# strings and searched with a substring test instead of the regex engine.
+MARKER_PATTERN_NAMES = ("ads_pattern", "inapp_purchases_pattern", "tracking_pattern")
+REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Short language names accepted by --language and the Play Store locale they stand for.
+LANGUAGE_ALIASES = {"es": "es-Es",
+                    "419": "es-419",
+                    "en": "en-US",
+                    "us": "en-US",
+                    "pt": "pt-PT",
+                    "fr": "fr-FR",
+                    "zh": "zh-CN",
+                    "br": "pt-BR",
+                    "gb": "en-GB",
+                    "ca": "fr-CA",
+                    "hk": "zh-HK",
+                    "tw": "zh-TW"}
+
+# Metadata fields that must be set for a package to be complete, with the values that count as not set.
+REQUIRED_METADATA_FIELDS = (("AuthorName", (None, "")),
+                            ("WebSite", (None, "")),
+                            ("Categories", (None, "", ["fdroid_repo"])),
+                            ("Name", (None, "")),
+                            ("Summary", (None, "")),
+                            ("Description", (None, "")),
+                            ("AuthorEmail", (None, "")),
+                            ("AntiFeatures", (None, "")),
+                            ("CurrentVersionCode", (None, "", 0, 2147483647)),
+                            ("CurrentVersion", (None, "", "0")),
+                            ("License", (None, "", "Unknown")))
+
+# Package name, version code and version name of the APK files probed with aapt, keyed by path, size and modification
+# time. Kept in APK_INFO_CACHE_FILE inside the cache directory so unchanged APK files aren't probed again on later runs.
+APK_INFO_CACHE = {}  # type: Dict[str, Tuple[str, int, str]]
+APK_INFO_CACHE_FILE = "apk_info.json"
+
+# Licenses looked up during this run keyed by API URL, apps of the same developer often share a repository.
+REPO_LICENSES = {}  # type: Dict[str, str]
+
+# Directories known to exist, see ensure_dir.
+CREATED_DIRS = set()
+
+# Runs the downloads that are done in the background while the caller downloads something else, shared by every
+# caller instead of starting a thread on each call. Only plain downloads are submitted so they can't wait on each other.
+BACKGROUND_DOWNLOADS = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS)
+
+# requests.Session isn't thread-safe, each download borrows an idle session from here and returns it once done so
+# connections are reused no matter which thread downloads next.
+HTTP_SESSIONS = queue.SimpleQueue()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Parser for PlayStore information to F-Droid YML metadata files.")
-    parser.add_argument("--metadata-dir",
-                        help="Directory where F-Droid metadata files are stored.",
-                        type=str,
-                        nargs=1)
-    parser.add_argument("--repo-dir",
-                        help="Directory where F-Droid repo files are stored.",
-                        type=str,
-                        nargs=1)
-    parser.add_argument("--unsigned-dir",
-                        help="Directory where unsigned app files are stored.",
-                        type=str,
-                        nargs=1)
+    # exactly one of the directories must be provided, argparse reports a missing or extra one by itself
+    dir_group = parser.add_mutually_exclusive_group(required=True)
+    dir_group.add_argument("--metadata-dir",
+                           help="Directory where F-Droid metadata files are stored.",
+                           type=str)
+    dir_group.add_argument("--repo-dir",
+                           help="Directory where F-Droid repo files are stored.",
+                           type=str)
+    dir_group.add_argument("--unsigned-dir",
+                           help="Directory where unsigned app files are stored.",
+                           type=str)
     parser.add_argument("--language",
                         help="Language of the information to retrieve.",
                         type=str,
-                        nargs=1,
                         required=True)
     parser.add_argument("--force-metadata",
                         help="Force overwrite existing metadata.",
@@ -69,45 +129,40 @@ def main():
                         action="store_true")
     parser.add_argument("--key-file",
                         help="Key file used to sign the APK, required if --convert-apks is used.",
-                        type=str,
-                        nargs=1)
+                        type=str)
     parser.add_argument("--cert-file",
                         help="Cert file used to sign the APK, required if --convert-apks is used.",
-                        type=str,
-                        nargs=1)
+                        type=str)
     parser.add_argument("--certificate-password",
                         help="Password to sign the APK.",
-                        type=str,
-                        nargs=1)
+                        type=str)
     parser.add_argument("--build-tools-path",
                         help="Path to Android SDK buildtools binaries.",
-                        type=str,
-                        nargs=1)
+                        type=str)
     parser.add_argument("--apk-editor-path",
                         help="Path to the ApkEditor.jar file.",
-                        type=str,
-                        nargs=1)
+                        type=str)
     parser.add_argument("--download-screenshots",
                         help="Download screenshots which will be stored in the repo directory.",
                         action="store_true")
     parser.add_argument("--data-file",
                         help="Path to the JSON formatted data file. "
                              "Default: data.json located in the program's directory.",
-                        type=str,
-                        nargs=1)
+                        type=str)
     parser.add_argument("--replacement-file",
                         help="JSON formatted file containing a dict with replacements for the package name of all found"
                              " apps.",
-                        type=str,
-                        nargs=1)
+                        type=str)
     parser.add_argument("--log-path",
                         help="Path to the directory where to store the log files. Default: Program's directory.",
-                        type=str,
-                        nargs=1)
+                        type=str)
     parser.add_argument("--cookie-path",
                         help="Path to a Netscape cookie file.",
-                        type=str,
-                        nargs=1)
+                        type=str)
+    parser.add_argument("--cache-path",
+                        help="Path to the directory where to cache the downloaded Play Store pages and license "
+                             "lookups between runs. By default pages are not cached.",
+                        type=str)
     parser.add_argument("--use-eng-name",
                         help="Use the English app name instead of the localized one.",
                         action="store_true")
@@ -123,79 +178,32 @@ def main():
                         action="store_true")
     parser.add_argument("--apktool-path",
                         help="Path to apktool. By default uses apktool.jar in the program's directory.",
-                        type=str,
-                        nargs=1)
+                        type=str)
 
     args = parser.parse_args()
 
     init(autoreset=True)
 
-    if args.metadata_dir is None:
-        metadata_dir = args.metadata_dir
-    else:
-        metadata_dir = os.path.abspath(args.metadata_dir[0])  # type: Optional[str]
-
-    if args.repo_dir is None:
-        repo_dir = args.repo_dir
-    else:
-        repo_dir = os.path.abspath(args.repo_dir[0])  # type: Optional[str]
-
-    if args.unsigned_dir is None:
-        unsigned_dir = args.unsigned_dir
-    else:
-        unsigned_dir = os.path.abspath(args.unsigned_dir[0])  # type: Optional[str]
-
-    if args.build_tools_path is None:
-        build_tools_path = args.build_tools_path
-    else:
-        build_tools_path = os.path.abspath(args.build_tools_path[0])  # type: Optional[str]
-
-    if args.key_file is None:
-        key_file = args.key_file
-    else:
-        key_file = os.path.abspath(args.key_file[0])  # type: Optional[str]
-
-    if args.cert_file is None:
-        cert_file = args.cert_file
-    else:
-        cert_file = os.path.abspath(args.cert_file[0])  # type: Optional[str]
-
-    if args.certificate_password is None:
-        certificate_password = args.certificate_password
-    else:
-        certificate_password = args.certificate_password[0]  # type: Optional[str]
-
-    if args.apk_editor_path is None:
-        apk_editor_path = args.apk_editor_path
-    else:
-        apk_editor_path = os.path.abspath(args.apk_editor_path[0])  # type: Optional[str]
-
-    if args.replacement_file is None:
-        replacement_file = args.replacement_file
-    else:
-        replacement_file = os.path.abspath(args.replacement_file[0])  # type: Optional[str]
-
-    if args.cookie_path is None:
-        cookie_path = args.cookie_path
-    else:
-        cookie_path = os.path.abspath(args.cookie_path[0])  # type: Optional[str]
-
-    if args.data_file is None:
-        data_file = os.path.join(get_program_dir(), "data.json")
-    else:
-        data_file = os.path.abspath(args.data_file[0])
-
-    if args.log_path is None:
-        log_path = get_program_dir()
-    else:
-        log_path = os.path.abspath(args.log_path[0])
-
-    if args.apktool_path is None:
-        apktool_path = os.path.join(get_program_dir(), "apktool.jar")
-    else:
-        apktool_path = os.path.abspath(args.apktool_path[0])
-
-    language = args.language[0]  # type: str
+    metadata_dir = get_abs_path(path_arg=args.metadata_dir)  # type: Optional[str]
+    repo_dir = get_abs_path(path_arg=args.repo_dir)  # type: Optional[str]
+    unsigned_dir = get_abs_path(path_arg=args.unsigned_dir)  # type: Optional[str]
+    build_tools_path = get_abs_path(path_arg=args.build_tools_path)  # type: Optional[str]
+    key_file = get_abs_path(path_arg=args.key_file)  # type: Optional[str]
+    cert_file = get_abs_path(path_arg=args.cert_file)  # type: Optional[str]
+    apk_editor_path = get_abs_path(path_arg=args.apk_editor_path)  # type: Optional[str]
+    replacement_file = get_abs_path(path_arg=args.replacement_file)  # type: Optional[str]
+    cookie_path = get_abs_path(path_arg=args.cookie_path)  # type: Optional[str]
+    cache_path = get_abs_path(path_arg=args.cache_path)  # type: Optional[str]
+
+    data_file = get_abs_path(path_arg=args.data_file,
+                             default=os.path.join(get_program_dir(), "data.json"))  # type: str
+    log_path = get_abs_path(path_arg=args.log_path,
+                            default=get_program_dir())  # type: str
+    apktool_path = get_abs_path(path_arg=args.apktool_path,
+                                default=os.path.join(get_program_dir(), "apktool.jar"))  # type: str
+
+    certificate_password = args.certificate_password  # type: Optional[str]
+    language = args.language  # type: str
 
     force_metadata = args.force_metadata  # type: bool
     force_version = args.force_version  # type: bool
@@ -210,88 +218,49 @@ def main():
     skip_if_exists = args.skip_if_exists  # type: bool
     recompile_bad_apk = args.recompile_bad_apk  # type: bool
 
-    if metadata_dir is None and repo_dir is None and unsigned_dir is None:
-        print(Fore.RED + "ERROR: Please provide at least the metadata directory, "
-                         "the repository directory or the unsigned directory.")
+    dir_path, provided_dir, dir_description = next((dir_path, dir_name, dir_description)
+                                                   for dir_path, dir_name, dir_description in
+                                                   ((metadata_dir, "metadata", "F-Droid repository metadata directory"),
+                                                    (repo_dir, "repo", "F-Droid repository directory"),
+                                                    (unsigned_dir, "unsigned", "F-Droid unsigned directory"))
+                                                   if dir_path is not None)
+    if os.path.basename(dir_path) != provided_dir:
+        print(Fore.RED + "ERROR: {} directory path doesn't look like a {}, aborting...".format(
+                provided_dir.capitalize(), dir_description))
         exit(1)
-
-    if metadata_dir is not None and repo_dir is not None and unsigned_dir is not None:
-        print(Fore.RED + "ERROR: Please provide only the metadata, "
-                         "the repository or the unsigned directory. Not all of them.")
+    elif not os.path.isdir(dir_path):
+        if not os.path.exists(dir_path):
+            print(Fore.RED + "ERROR: {} directory path doesn't exist, aborting...".format(provided_dir.capitalize()))
+        else:
+            print(Fore.RED + "ERROR: Invalid {} directory, supplied path is not a directory".format(provided_dir))
         exit(1)
 
-    if ((metadata_dir is not None and repo_dir is not None)
-            or (repo_dir is not None and unsigned_dir is not None)
-            or (metadata_dir is not None and unsigned_dir is not None)):
-        print(Fore.RED + "ERROR: Please provide only one of the directories.")
-        exit(1)
-
-    if metadata_dir is not None:
-        provided_dir = "metadata"
-        if os.path.split(metadata_dir)[1] != "metadata":
-            print(Fore.RED + "ERROR: Metadata directory path doesn't look like a "
-                             "F-Droid repository metadata directory, aborting...")
-            exit(1)
-        elif not os.path.exists(metadata_dir):
-            print(Fore.RED + "ERROR: Metadata directory path doesn't exist, aborting...")
-            exit(1)
-        elif not os.path.isdir(metadata_dir):
-            print(Fore.RED + "ERROR: Invalid metadata directory, supplied path is not a directory")
-            exit(1)
-
-    if repo_dir is not None:
-        provided_dir = "repo"
-        if os.path.split(repo_dir)[1] != "repo":
-            print(Fore.RED + "ERROR: Repo directory path doesn't look like a F-Droid repository directory, aborting...")
-            exit(1)
-        elif not os.path.exists(repo_dir):
-            print(Fore.RED + "ERROR: Repo directory path doesn't exist, aborting...")
-            exit(1)
-        elif not os.path.isdir(repo_dir):
-            print(Fore.RED + "ERROR: Invalid repo directory, supplied path is not a directory")
-            exit(1)
-
-    if unsigned_dir is not None:
-        provided_dir = "unsigned"
-        if os.path.split(unsigned_dir)[1] != "unsigned":
-            print(Fore.RED + "ERROR: Unsigned directory path doesn't look like a F-Droid unsigned directory, "
-                             "aborting...")
-            exit(1)
-        elif not os.path.exists(unsigned_dir):
-            print(Fore.RED + "ERROR: Unsigned directory path doesn't exist, aborting...")
-            exit(1)
-        if not os.path.isdir(unsigned_dir):
-            print(Fore.RED + "ERROR: Invalid unsigned directory, supplied path is not a directory")
-            exit(1)
-
-    if not os.path.isfile(data_file):
-        print(Fore.RED + "ERROR: Invalid data file.")
+    if not check_files(file_checks=[(data_file, "ERROR: Invalid data file."),
+                                    (replacement_file, "ERROR: Invalid replacement file."),
+                                    (cookie_path, "ERROR: Invalid cookie file path.")]):
         exit(1)
 
     if build_tools_path is None:
-        if shutil.which("aapt") is None:
+        if find_tool(tool_name="aapt") is None:
             print(Fore.RED + "ERROR: Please install aapt before running this program.")
             exit(1)
 
-        if shutil.which("aapt2") is None:
+        if find_tool(tool_name="aapt2") is None:
             print(Fore.RED + "ERROR: Please install aapt2 before running this program.")
             exit(1)
 
-    if replacement_file is not None and not os.path.isfile(replacement_file):
-        print(Fore.RED + "ERROR: Invalid replacement file.")
-        exit(1)
-
     if recompile_bad_apk:
         if not os.path.exists(apktool_path):
             print(Fore.RED + "ERROR: Apktool JAR file was not found. Required to recompile APK files.")
             exit(1)
 
-        if shutil.which("java") is None:
+        if find_tool(tool_name="java") is None:
             print(Fore.RED + "ERROR: Please install java if you want to recompile APK files.")
             exit(1)
 
     try:
-        data_file_stream = open(data_file, mode="r", encoding="utf_8")
+        with open(data_file, mode="rb") as data_file_stream:
+            data_file_bytes = data_file_stream.read()
     except FileNotFoundError:
         print(Fore.RED + "ERROR: Data file not found.")
         exit(1)
@@ -300,17 +269,23 @@ def main():
         exit(1)
 
     try:
-        data_file_content = json.load(data_file_stream)  # type: dict
-    except json.decoder.JSONDecodeError as e:
+        data_file_content = json.loads(data_file_bytes)  # type: dict
+    except (json.decoder.JSONDecodeError, UnicodeDecodeError) as e:
         print(Fore.RED + "ERROR: Error decoding data file.", end="\n\n")
         print(e)
         exit(1)
 
-    data_file_stream.close()
-
     if not check_data_file(data_file_content=data_file_content):
         exit(1)
 
+    if not compile_patterns(data_file_content=data_file_content):
+        exit(1)
+
+    index_licenses(data_file_content=data_file_content)
+    index_locales(data_file_content=data_file_content)
+
+    replacements = load_replacements(replacement_file=replacement_file)  # type: Optional[Dict[str, str]]
+
     lang = sanitize_lang(lang=language)
 
     if lang not in data_file_content["Locales"]["Play_Store"]:
@@ -319,13 +294,9 @@ def main():
 
     if cookie_path is None:
         print(Fore.YELLOW + "WARNING: Cookie file not specified, Amazon scraping wont work.", end="\n\n")
-    else:
-        if not os.path.isfile(cookie_path):
-            print(Fore.RED + "ERROR: Invalid cookie file path.")
-            exit(1)
 
     if convert_apks:
-        if build_tools_path is None and shutil.which("apksigner") is None:
+        if build_tools_path is None and find_tool(tool_name="apksigner") is None:
             print(Fore.RED + "ERROR: Please install the build-tools package of "
                              "the Android SDK if you want to convert APKS files.")
             exit(1)
@@ -337,36 +308,36 @@ def main():
                 print(Fore.RED + "ERROR: Invalid build-tools path.")
                 exit(1)
 
-        if shutil.which("java") is None:
+        if find_tool(tool_name="java") is None:
             print(Fore.RED + "ERROR: Please install java if you want to convert APKS files.")
             exit(1)
 
         if apk_editor_path is None:
             print(Fore.RED + "ERROR: Please specify the full path of the ApkEditor.jar file.")
             exit(1)
-        elif not os.path.isfile(apk_editor_path):
-            print(Fore.RED + "ERROR: Invalid ApkEditor.jar path.")
-            exit(1)
 
-        if sign_apk:
-            if key_file is None or cert_file is None:
-                print(Fore.RED + "ERROR: Please provide the key and certificate files for APK signing.", end="\n\n")
-                exit(1)
-            else:
-                if not os.path.isfile(key_file):
-                    print(Fore.RED + "ERROR: Invalid key file path.")
-                    exit(1)
+        if sign_apk and (key_file is None or cert_file is None):
+            print(Fore.RED + "ERROR: Please provide the key and certificate files for APK signing.", end="\n\n")
+            exit(1)
 
-                if not os.path.isfile(cert_file):
-                    print(Fore.RED + "ERROR: Invalid cert file path.")
-                    exit(1)
+        if not check_files(file_checks=[(apk_editor_path, "ERROR: Invalid ApkEditor.jar path."),
+                                        (key_file if sign_apk else None, "ERROR: Invalid key file path."),
+                                        (cert_file if sign_apk else None, "ERROR: Invalid cert file path.")]):
+            exit(1)
 
     if os.path.exists(log_path) and not os.path.isdir(log_path):
         print(Fore.RED + "Invalid log path.")
         exit(1)
 
-    if not os.path.exists(log_path):
-        os.makedirs(log_path)
+    os.makedirs(log_path, exist_ok=True)
+
+    if cache_path is not None:
+        if os.path.exists(cache_path) and not os.path.isdir(cache_path):
+            print(Fore.RED + "ERROR: Invalid cache path.")
+            exit(1)
+
+        os.makedirs(cache_path, exist_ok=True)
+        load_apk_info_cache(cache_path=cache_path)
 
     package_list = {}
     package_and_version = {}
@@ -377,16 +348,16 @@ def main():
         force_icons = True
 
     if metadata_dir is not None:  # program needs repo_dir to store icons & screenshots.
-        repo_dir = os.path.join(os.path.split(metadata_dir)[0], "repo")
+        repo_dir = os.path.join(os.path.dirname(metadata_dir), "repo")
         os.makedirs(repo_dir, exist_ok=True)
         dir_to_process = repo_dir
     elif repo_dir is not None:  # program needs metadata_dir to store the YAML files.
-        metadata_dir = os.path.join(os.path.split(repo_dir)[0], "metadata")
+        metadata_dir = os.path.join(os.path.dirname(repo_dir), "metadata")
         os.makedirs(metadata_dir, exist_ok=True)
         dir_to_process = repo_dir
     elif unsigned_dir is not None:  # program needs both repo_dir and metadata_dir, nothing is saved in unsigned_dir.
-        metadata_dir = os.path.join(os.path.split(unsigned_dir)[0], "metadata")
-        repo_dir = os.path.join(os.path.split(unsigned_dir)[0], "repo")
+        metadata_dir = os.path.join(os.path.dirname(unsigned_dir), "metadata")
+        repo_dir = os.path.join(os.path.dirname(unsigned_dir), "repo")
         os.makedirs(metadata_dir, exist_ok=True)
         os.makedirs(repo_dir, exist_ok=True)
         dir_to_process = unsigned_dir
@@ -403,13 +374,15 @@ def main():
 
     if rename_files:
         print(Fore.GREEN + "Renaming files...", end="\n\n")
+        import renamer
         renamer.process_path(item_path=dir_to_process,
                              pattern="%package_name%_%version_code%",
                              skip_if_exists=skip_if_exists,
                              build_tools_path=build_tools_path)
 
-    if recompile_bad_apk and len(os.listdir(dir_to_process)) != 0:
+    if recompile_bad_apk and not is_dir_empty(dir_path=dir_to_process):
         print(Fore.GREEN + "Checking and recompiling APK files...", end="\n\n")
+        import recompiler
         recompiler.start_processing(path=dir_to_process,
                                     apktool_path=apktool_path,
                                     build_tools_path=build_tools_path)
@@ -418,40 +391,31 @@ def main():
     if provided_dir == "metadata":
         print(Fore.GREEN + "Getting package names, version names and version codes...", end="\n\n")
 
-        mapped_apk_files = map_apk_to_packagename(repo_dir=repo_dir)
+        mapped_apk_files = map_apk_to_packagename(repo_dir=repo_dir,
+                                                  build_tools_path=build_tools_path)
 
-        for item in os.listdir(metadata_dir):
-            base_name = os.path.splitext(item)[0]
-            try:
-                apk_file_path = os.path.join(repo_dir, mapped_apk_files[base_name])
-            except KeyError:
-                apk_file_path = None
+        with os.scandir(metadata_dir) as dir_entries:
+            for entry in dir_entries:
+                item = entry.name
+                base_name, _, extension = item.rpartition(".")
 
-            if os.path.splitext(item)[1].lower() != ".yml":
-                print(Fore.YELLOW + "WARNING: Skipping {}.".format(item), end="\n\n")
-            else:
-                new_base_name = get_new_packagename(replacement_file=replacement_file,
-                                                    base_name=base_name)
+                if not entry.is_file() or extension.lower() != "yml" or base_name == "":
+                    print(Fore.YELLOW + "WARNING: Skipping {}.".format(item), end="\n\n")
+                else:
+                    new_base_name = get_new_packagename(replacements=replacements,
+                                                        base_name=base_name)
+                    if new_base_name is None:
+                        new_base_name = base_name
 
-                if new_base_name is not None:
                     package_list[base_name] = new_base_name
-                else:
-                    package_list[base_name] = base_name
-
-                if apk_file_path is not None and os.path.isfile(apk_file_path):
-                    apk_info = renamer.get_info(app_file_path=apk_file_path,
-                                                build_tools_path=build_tools_path)
-                    if new_base_name is not None:
-                        package_and_version[new_base_name] = (int(apk_info["Version Code"]),
-                                                              str(apk_info["Version Name"]))
+
+                    apk_info = mapped_apk_files.get(base_name)
+                    if apk_info is not None:
+                        package_and_version[new_base_name] = apk_info[1:]
                     else:
-                        package_and_version[base_name] = (int(apk_info["Version Code"]),
-                                                          str(apk_info["Version Name"]))
-                else:
-                    if new_base_name is not None:
                         package_and_version[new_base_name] = (0, "0")
-                    else:
-                        package_and_version[base_name] = (0, "0")
+
+        save_apk_info_cache(cache_path=cache_path)
 
         retrieve_info(package_list=package_list,
                       package_and_version=package_and_version,
@@ -466,30 +430,33 @@ def main():
                       data_file_content=data_file_content,
                       log_path=log_path,
                       cookie_path=cookie_path,
+                      cache_path=cache_path,
                       use_eng_name=use_eng_name)
     elif provided_dir in ("repo", "unsigned"):
         print(Fore.GREEN + "Getting package names, version names and version codes...", end="\n\n")
 
-        for apk_file in os.listdir(dir_to_process):
-            apk_file_path = os.path.join(dir_to_process, apk_file)
+        with os.scandir(dir_to_process) as dir_entries:
+            apk_file_paths = [entry.path for entry in dir_entries
+                              if entry.is_file() and entry.name.lower().endswith(".apk")]
 
-            if os.path.isfile(apk_file_path) and os.path.splitext(apk_file)[1].lower() == ".apk":
-                apk_info = renamer.get_info(apk_file_path)
-                base_name = apk_info["Package Name"]
-                new_base_name = get_new_packagename(replacement_file=replacement_file,
-                                                    base_name=base_name)
+        for apk_info in get_apk_infos(apk_file_paths=apk_file_paths,
+                                      build_tools_path=build_tools_path):
+            if apk_info is None:
+                continue
 
-                if new_base_name is not None:
-                    package_list[base_name] = new_base_name
-                    package_and_version[new_base_name] = (int(apk_info["Version Code"]),
-                                                          str(apk_info["Version Name"]))
-                else:
-                    package_list[base_name] = base_name
-                    package_and_version[base_name] = (int(apk_info["Version Code"]),
-                                                      str(apk_info["Version Name"]))
+            base_name = apk_info[0]
+            new_base_name = get_new_packagename(replacements=replacements,
+                                                base_name=base_name)
+            if new_base_name is None:
+                new_base_name = base_name
+
+            package_list[base_name] = new_base_name
+            package_and_version[new_base_name] = apk_info[1:]
 
         print(Fore.GREEN + "Finished getting package names, version names and version codes.", end="\n\n")
 
+        save_apk_info_cache(cache_path=cache_path)
+
         retrieve_info(package_list=package_list,
                       package_and_version=package_and_version,
                       lang=lang,
@@ -503,41 +470,67 @@ def main():
                       data_file_content=data_file_content,
                       log_path=log_path,
                       cookie_path=cookie_path,
+                      cache_path=cache_path,
                       use_eng_name=use_eng_name)
     else:
         print(Fore.RED + "ERROR: We shouldn't have got here.")
         exit(1)
 
 
-def get_new_packagename(replacement_file: Optional[str],
-                        base_name: str) -> Optional[str]:
-    if replacement_file is not None:
-        try:
-            replace_stream = open(replacement_file, encoding="utf_8", mode="r")
-        except UnicodeDecodeError as e:
-            print("ERROR: Decode error.", end="\n\n")
-            print(e, end="\n\n")
-            return None
-        except PermissionError as e:
-            print("ERROR: Couldn't open replacement file. Permission denied.", end="\n\n")
-            print(e, end="\n\n")
-            return None
+def get_abs_path(path_arg: Optional[str],
+                 default: Optional[str] = None) -> Optional[str]:
+    if path_arg is None:
+        return default
+    else:
+        return os.path.abspath(path_arg)
 
-        try:
-            replacements = json.load(replace_stream)["Replacements"]  # type: Dict[str, str]
-        except PermissionError as e:
-            print(Fore.RED + "ERROR: Couldn't read replacement file. Permission denied.", end="\n\n")
-            print(e, end="\n\n")
-            exit(1)
-        except json.decoder.JSONDecodeError as e:
-            print(Fore.RED + "ERROR: Couldn't load replacement file. Decoding error.", end="\n\n")
-            print(e, end="\n\n")
-            exit(1)
 
-        for term in replacements.keys():
-            search_term = term
-            replace_term = replacements[term]
+def is_dir_empty(dir_path: str) -> bool:
+    # Stops at the first entry instead of listing the whole directory.
+    with os.scandir(dir_path) as dir_entries:
+        return next(dir_entries, None) is None
+
+
+@functools.lru_cache(maxsize=None)
+def find_tool(tool_name: str) -> Optional[str]:
+    return shutil.which(tool_name)
+
+
+def check_files(file_checks: List[Tuple[Optional[str], str]]) -> bool:
+    # Each entry is (path, error message), paths of features not in use are None and skipped.
+    for file_path, error_message in file_checks:
+        if file_path is not None and not os.path.isfile(file_path):
+            print(Fore.RED + error_message)
+            return False
+
+    return True
 
+
+def load_replacements(replacement_file: Optional[str]) -> Optional[Dict[str, str]]:
+    # The replacement file is read once, get_new_packagename is called for every package.
+    if replacement_file is None:
+        return None
+
+    try:
+        with open(replacement_file, mode="rb") as replace_stream:
+            replace_bytes = replace_stream.read()
+    except PermissionError as e:
+        print("ERROR: Couldn't open replacement file. Permission denied.", end="\n\n")
+        print(e, end="\n\n")
+        return None
+
+    try:
+        return json.loads(replace_bytes)["Replacements"]
+    except (json.decoder.JSONDecodeError, UnicodeDecodeError) as e:
+        print(Fore.RED + "ERROR: Couldn't load replacement file. Decoding error.", end="\n\n")
+        print(e, end="\n\n")
+        exit(1)
+
+
+def get_new_packagename(replacements: Optional[Dict[str, str]],
+                        base_name: str) -> Optional[str]:
+    if replacements is not None:
+        for search_term, replace_term in replacements.items():
             if search_term in base_name:
                 base_name = base_name.replace(search_term, replace_term)
                 break
@@ -548,30 +541,63 @@ def get_new_packagename(replacement_file: Optional[str],
 
 def check_data_file(data_file_content) -> bool:
 
-    for key_name in ("Locales",
-                     "Licenses",
-                     "App_Categories",
-                     "Game_Categories",
-                     "Icon_Relations",
-                     "Regex_Patterns",
-                     "Sport_Category_Pattern"):
-        if data_file_content.get(key_name) is None or len(data_file_content[key_name]) == 0:
+    for key_name, key_type in (("Locales", dict),
+                               ("Licenses", list),
+                               ("App_Categories", dict),
+                               ("Game_Categories", dict),
+                               ("Icon_Relations", dict),
+                               ("Regex_Patterns", dict),
+                               ("Sport_Category_Pattern", dict)):
+        key_value = data_file_content.get(key_name)
+
+        if not key_value:
             print(Fore.RED + "ERROR: \"{}\" key is missing or empty in the data file.".format(key_name), end="\n\n")
             return False
 
-        if key_name == "Licenses":
-            if type(data_file_content.get(key_name)) is not list:
-                print(Fore.RED + "ERROR: \"{}\" key is wrong type, should be a list and currently it's a {}".format(
-                        key_name, type(data_file_content.get(key_name))))
-                return False
-        elif type(data_file_content.get(key_name)) is not dict:
-            print(Fore.RED + "ERROR: \"{}\" key is wrong type, should be a dict and currently it's a {}".format(
-                    key_name, type(data_file_content.get(key_name))))
+        if type(key_value) is not key_type:
+            print(Fore.RED + "ERROR: \"{}\" key is wrong type, should be a {} and currently it's a {}".format(
+                    key_name, key_type.__name__, type(key_value)))
             return False
 
     return True
 
 
+def compile_patterns(data_file_content: dict) -> bool:
+    # Compile the data file's patterns once so every package reuses them instead of going through re's cache on each
+    # search, empty patterns become None.
+    for store_name, patterns in data_file_content["Regex_Patterns"].items():
+        for pattern_name, pattern in patterns.items():
+            if pattern == "":
+                patterns[pattern_name] = None
+                continue
+
+            if pattern_name in MARKER_PATTERN_NAMES and REGEX_SPECIAL_CHARACTERS.isdisjoint(pattern):
+                continue
+
+            try:
+                patterns[pattern_name] = re.compile(pattern)
+            except re.error as e:
+                print(Fore.RED + "ERROR: Invalid \"{}\" pattern for \"{}\" in the data file.".format(pattern_name,
+                                                                                                 store_name),
+                      end="\n\n")
+                print(e)
+                return False
+
+    return True
+
+
+def index_licenses(data_file_content: dict) -> None:
+    # Licenses are looked up case-insensitively for every package, map the normalized names to the data file's ones
+    # once instead of rebuilding the table on each lookup.
+    data_file_content["Licenses"] = {key.lower().strip(): key for key in data_file_content["Licenses"]}
+
+
+def index_locales(data_file_content: dict) -> None:
+    # The store locales are only used for membership checks, done for every package on Apkcombo.
+    data_file_content["Locales"] = {store_name: frozenset(locales)
+                                    for store_name, locales in data_file_content["Locales"].items()}
+
+
 def convert_apks_to_apk(apks_dir: str,
                         apk_editor_path: str,
                         sign_apk: bool,
@@ -579,22 +605,29 @@ def convert_apks_to_apk(apks_dir: str,
                         cert_file: str,
                         password: Optional[str],
                         build_tools_path: Optional[str]) -> None:
-    proc = False
-
-    for file in os.listdir(apks_dir):
-        if os.path.splitext(file)[1].lower() != ".apks":
-            continue
-
-        apks_path = os.path.join(apks_dir, file)
-        proc = True
-
-        renamer.convert_to_apk(apks_file=apks_path,
-                               apk_editor_path=apk_editor_path,
-                               sign_apk=sign_apk,
-                               build_tools_path=build_tools_path,
-                               key_file=key_file,
-                               cert_file=cert_file,
-                               certificate_password=password)
+    import renamer
+
+    with os.scandir(apks_dir) as dir_entries:
+        apks_paths = [entry.path for entry in dir_entries
+                      if entry.is_file() and entry.name.lower().endswith(".apks")]
+
+    proc = len(apks_paths) != 0
+
+    # Each conversion starts its own JVM (and apksigner), so run a few of them at the same time. The pool is kept
+    # small because every ApkEditor instance loads the whole APKS file in memory.
+    with ThreadPoolExecutor(max_workers=min(MAX_CONVERSION_WORKERS, os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(renamer.convert_to_apk,
+                                   apks_file=apks_path,
+                                   apk_editor_path=apk_editor_path,
+                                   sign_apk=sign_apk,
+                                   build_tools_path=build_tools_path,
+                                   key_file=key_file,
+                                   cert_file=cert_file,
+                                   certificate_password=password)
+                   for apks_path in apks_paths]
+
+        for future in futures:
+            future.result()
 
     if proc:
         print(Fore.GREEN + "Finished converting all APKS files.", end="\n\n")
@@ -602,32 +635,128 @@ def convert_apks_to_apk(apks_dir: str,
         print(Fore.GREEN + "No APKS files were converted.", end="\n\n")
 
 
-def map_apk_to_packagename(repo_dir: str) -> Dict:
+def map_apk_to_packagename(repo_dir: str,
+                           build_tools_path: Optional[str]) -> Dict[str, Tuple[str, int, str]]:
+    # Maps each package name to the information of its APK file in repo_dir.
     mapped_apk_files = {}
 
-    for apk_file in os.listdir(repo_dir):
-        apk_file_path = os.path.join(repo_dir, apk_file)
-        if os.path.isfile(apk_file_path) and os.path.splitext(apk_file_path)[1].lower() == ".apk":
-            mapped_apk_files[renamer.get_info(apk_file_path)["Package Name"]] = apk_file
+    with os.scandir(repo_dir) as dir_entries:
+        apk_file_paths = [entry.path for entry in dir_entries
+                          if entry.is_file() and entry.name.lower().endswith(".apk")]
+
+    for apk_info in get_apk_infos(apk_file_paths=apk_file_paths,
+                                  build_tools_path=build_tools_path):
+        if apk_info is not None:
+            mapped_apk_files[apk_info[0]] = apk_info
 
     return mapped_apk_files
 
 
+def get_apk_infos(apk_file_paths: List[str],
+                  build_tools_path: Optional[str]) -> List[Optional[Tuple[str, int, str]]]:
+    # Every probe waits on its own aapt process, so several APK files are probed at the same time. Results keep the
+    # order of apk_file_paths.
+    with ThreadPoolExecutor(max_workers=MAX_PROBE_WORKERS) as executor:
+        return list(executor.map(functools.partial(get_apk_info, build_tools_path=build_tools_path),
+                                 apk_file_paths))
+
+
+def get_apk_info(apk_file_path: str,
+                 build_tools_path: Optional[str]) -> Optional[Tuple[str, int, str]]:
+    # The file's size and modification time are part of the cache key so a replaced APK file is probed again.
+    apk_stat = os.stat(apk_file_path)
+    cache_key = get_apk_info_cache_key(apk_file_path=apk_file_path, apk_stat=apk_stat)
+
+    apk_info = APK_INFO_CACHE.get(cache_key)
+    if apk_info is not None:
+        return apk_info
+
+    apk_info = probe_apk(apk_file_path=apk_file_path,
+                         build_tools_path=build_tools_path)
+    if apk_info is not None:
+        APK_INFO_CACHE[cache_key] = apk_info
+
+    return apk_info
+
+
+def get_apk_info_cache_key(apk_file_path: str,
+                           apk_stat: os.stat_result) -> str:
+    return "{}:{}:{}".format(apk_file_path, apk_stat.st_size, apk_stat.st_mtime_ns)
+
+
+def load_apk_info_cache(cache_path: str) -> None:
+    try:
+        with open(os.path.join(cache_path, APK_INFO_CACHE_FILE), encoding="utf_8") as cache_stream:
+            cached_info = json.load(cache_stream)  # type: Dict[str, list]
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        print(Fore.YELLOW + "WARNING: Couldn't load the APK information cache, APK files will be probed again.")
+        print(Fore.YELLOW + str(e), end="\n\n")
+        return
+
+    for cache_key, (package_name, version_code, version_name) in cached_info.items():
+        APK_INFO_CACHE[cache_key] = (package_name, int(version_code), str(version_name))
+
+
+def save_apk_info_cache(cache_path: Optional[str]) -> None:
+    if cache_path is None:
+        return
+
+    # Entries of APK files that were deleted or replaced since they were probed are dropped.
+    cached_info = {}
+    for cache_key, apk_info in APK_INFO_CACHE.items():
+        apk_file_path = cache_key.rsplit(":", 2)[0]
+        try:
+            apk_stat = os.stat(apk_file_path)
+        except OSError:
+            continue
+
+        if get_apk_info_cache_key(apk_file_path=apk_file_path, apk_stat=apk_stat) == cache_key:
+            cached_info[cache_key] = apk_info
+
+    try:
+        with open(os.path.join(cache_path, APK_INFO_CACHE_FILE), "w", encoding="utf_8") as cache_stream:
+            json.dump(cached_info, cache_stream)
+    except OSError as e:
+        print(Fore.YELLOW + "WARNING: Couldn't write the APK information cache.")
+        print(Fore.YELLOW + str(e), end="\n\n")
+
+
+def probe_apk(apk_file_path: str,
+              build_tools_path: Optional[str]) -> Optional[Tuple[str, int, str]]:
+    # Only the package name, version code and version name are needed, aapt is run once per APK file.
+    import renamer
+
+    apk_info = renamer.get_info(app_file_path=apk_file_path,
+                                build_tools_path=build_tools_path)
+
+    if len(apk_info) == 0:
+        return None
+
+    return (apk_info[renamer.PACKAGE_NAME],
+            int(apk_info[renamer.PACKAGE_VERSION_CODE]),
+            str(apk_info[renamer.PACKAGE_VERSION_NAME]))
+
+
 def get_version(package_content: dict,
                 package_and_version: Dict[str, Tuple[int, str]],
                 new_package: str,
                 force_metadata: bool,
                 force_version: bool) -> None:
-    if (package_content.get("CurrentVersionCode", "") == "" or package_content.get("CurrentVersionCode", "") == 0
-            or package_content.get("CurrentVersionCode", "") == 2147483647
-            or package_content.get("CurrentVersionCode") is None or force_metadata or force_version):
+    if needs_value(package_content=package_content,
+                   field_name="CurrentVersionCode",
+                   force=force_metadata or force_version,
+                   unset_values=(None, "", 0, 2147483647)):
         if package_and_version[new_package][0] is not None:
             package_content["CurrentVersionCode"] = int(package_and_version[new_package][0])
         else:
             package_content["CurrentVersionCode"] = 0
 
-    if (package_content.get("CurrentVersion", "") == "" or package_content.get("CurrentVersion", "") == "0"
-            or package_content.get("CurrentVersion") is None or force_metadata or force_version):
+    if needs_value(package_content=package_content,
+                   field_name="CurrentVersion",
+                   force=force_metadata or force_version,
+                   unset_values=(None, "", "0")):
         if package_and_version[new_package][1] is not None:
             package_content["CurrentVersion"] = str(package_and_version[new_package][1])
         else:
@@ -647,6 +776,7 @@ def retrieve_info(package_list: Dict[str, str],
                   data_file_content: dict,
                   log_path: str,
                   cookie_path: Optional[str],
+                  cache_path: Optional[str],
                   use_eng_name: bool) -> None:
 
     proc = False
@@ -662,11 +792,18 @@ def retrieve_info(package_list: Dict[str, str],
     icon_not_found_packages = []
     screenshots_not_found_packages = []
 
-    for pkg in package_list.keys():
-        package = pkg
-        new_package = package_list[pkg]
+    # Packages that need their store page, the pages are downloaded in the background once all packages are checked.
+    pending_packages = []
 
-        print(Fore.GREEN + "Processing " + package + "...", end="\n\n")
+    # The force arguments don't change between packages, combine them once.
+    check_metadata_and_icons = not force_metadata and not force_icons
+    check_all = check_metadata_and_icons and not force_screenshots
+    check_version_only = force_version and check_all
+
+    for package, new_package in package_list.items():
+        version_code = package_and_version[new_package][0]
+
+        print(Fore.GREEN + "Checking " + package + "...", end="\n\n")
 
         package_content = load_yml(metadata_dir=metadata_dir,
                                    package=package)
@@ -674,26 +811,32 @@ def retrieve_info(package_list: Dict[str, str],
         if package_content is None:
             continue
 
-        package_content_orig = copy.deepcopy(package_content)
+        # Only a snapshot for telling whether anything changed, the getters replace top level fields and never modify
+        # the nested lists or dicts in place, so a shallow copy is enough.
+        package_content_orig = dict(package_content)
 
         metadata_exist = None
         icons_exist = None
         screenshots_exist = None
 
         # If none of the force arguments is declared then check for available metadata, if screenshots
-        # should be downloaded then check if they exist, otherwise check only for the rest of the data
+        # should be downloaded then check if they exist, otherwise check only for the rest of the data.
+        # The checks go from cheapest to most expensive and stop at the first missing part, the ones left as None are
+        # done later only if they are still needed.
         if dl_screenshots:
-            if not force_metadata and not force_screenshots and not force_icons:
+            if check_all:
                 metadata_exist = is_metadata_complete(package_content=package_content)
-                icons_exist = is_icon_complete(package=package,
-                                               version_code=package_and_version[new_package][0],
-                                               repo_dir=repo_dir,
-                                               data_file_content=data_file_content)
-                screenshots_exist = screenshot_exist(package=package,
-                                                     repo_dir=repo_dir)
+                if metadata_exist:
+                    icons_exist = is_icon_complete(package=package,
+                                                   version_code=version_code,
+                                                   repo_dir=repo_dir,
+                                                   data_file_content=data_file_content)
+                if icons_exist:
+                    screenshots_exist = screenshot_exist(package=package,
+                                                         repo_dir=repo_dir)
 
                 if metadata_exist and icons_exist and screenshots_exist:
-                    if package_and_version[new_package][0] is None:
+                    if version_code is None:
                         print(Fore.BLUE + "\tSkipping processing for the package as all the metadata"
                                           " is complete in the YML file, and screenshots exist.", end="\n\n")
                         continue
@@ -702,15 +845,16 @@ def retrieve_info(package_list: Dict[str, str],
                                           "the YML file, all the icons are available and screenshots exist.",
                               end="\n\n")
                         continue
-        elif not force_metadata and not force_icons:
+        elif check_metadata_and_icons:
             metadata_exist = is_metadata_complete(package_content=package_content)
-            icons_exist = is_icon_complete(package=package,
-                                           version_code=package_and_version[new_package][0],
-                                           repo_dir=repo_dir,
-                                           data_file_content=data_file_content)
+            if metadata_exist:
+                icons_exist = is_icon_complete(package=package,
+                                               version_code=version_code,
+                                               repo_dir=repo_dir,
+                                               data_file_content=data_file_content)
 
             if metadata_exist and icons_exist:
-                if package_and_version[new_package][0] is None:
+                if version_code is None:
                     print(Fore.BLUE + "\tSkipping processing for the package as all the metadata "
                                       "is complete in the YML file.", end="\n\n")
                     continue
@@ -719,8 +863,7 @@ def retrieve_info(package_list: Dict[str, str],
                                       "YML file and all the icons are available.", end="\n\n")
                     continue
 
-        if (force_version and not force_metadata and not force_screenshots and not force_icons and metadata_exist
-                and icons_exist):
+        if check_version_only and metadata_exist and icons_exist:
             if screenshots_exist is not None:
                 screenshots_exist = screenshot_exist(package=package,
                                                      repo_dir=repo_dir)
@@ -741,40 +884,31 @@ def retrieve_info(package_list: Dict[str, str],
                               package_content=package_content)
                 continue
 
-        proc = True
+        pending_packages.append((package, new_package, package_content, package_content_orig, metadata_exist,
+                                 icons_exist, screenshots_exist))
 
-        resp_list = []
+    store_pages = prefetch(function=functools.partial(fetch_store_page,
+                                                      language=lang,
+                                                      cookie_path=cookie_path,
+                                                      cache_path=cache_path,
+                                                      refresh_cache=force_metadata,
+                                                      data_file_content=data_file_content),
+                           items=[pending_package[1] for pending_package in pending_packages],
+                           max_workers=MAX_DOWNLOAD_WORKERS)
 
-        skip_package = False
-        store_name = None
+    for pending_package, (store_name, resp_list, messages) in zip(pending_packages, store_pages):
+        (package, new_package, package_content, package_content_orig, metadata_exist, icons_exist,
+         screenshots_exist) = pending_package
 
-        for _ in [1]:
-            print(Fore.GREEN + "\tDownloading Play Store page...", end="\n\n")
-            if get_play_store_page(new_package=new_package,
-                                   resp_list=resp_list,
-                                   language=lang):
-                store_name = "Play_Store"
-                break
-            resp_list = []
-
-            print(Fore.GREEN + "\tDownloading Amazon Appstore page...", end="\n\n")
-            if get_amazon_page(resp_list=resp_list,
-                               language=lang,
-                               new_package=new_package,
-                               cookie_path=cookie_path):
-                store_name = "Amazon_Store"
-                break
-            resp_list = []
-
-            print(Fore.GREEN + "\tDownloading Apkcombo page...", end="\n\n")
-            if get_apkcombo_page(resp_list=resp_list,
-                                 language=lang,
-                                 new_package=new_package,
-                                 data_file_content=data_file_content):
-                store_name = "Apkcombo_Store"
-                break
-            resp_list = []
+        print(Fore.GREEN + "Processing " + package + "...", end="\n\n")
+
+        for message in messages:
+            print(message, end="\n\n")
 
+        proc = True
+        version_code = package_and_version[new_package][0]
+
+        if store_name is None:
             not_found_packages.append(package)
 
             get_version(package_content=package_content,
@@ -789,9 +923,6 @@ def retrieve_info(package_list: Dict[str, str],
                           package_content=package_content)
 
             print(Fore.GREEN + "Finished processing {}.".format(package), end="\n\n")
-            skip_package = True
-
-        if skip_package:
             continue
 
         resp = resp_list[0]
@@ -799,26 +930,10 @@ def retrieve_info(package_list: Dict[str, str],
 
         print(Fore.GREEN + "\tExtracting information...", end="\n\n")
 
-        if not force_metadata:
-            if metadata_exist is None:
-                metadata_exist = is_metadata_complete(package_content=package_content)
-            if not metadata_exist:
-                get_metadata(package_content=package_content,
-                             resp=resp,
-                             resp_int=resp_int,
-                             package=package,
-                             name_not_found_packages=name_not_found_packages,
-                             authorname_not_found_packages=authorname_not_found_packages,
-                             authoremail_not_found_packages=authoremail_not_found_packages,
-                             website_not_found_packages=website_not_found_packages,
-                             category_not_found_packages=category_not_found_packages,
-                             summary_not_found_packages=summary_not_found_packages,
-                             description_not_found_packages=description_not_found_packages,
-                             force_metadata=force_metadata,
-                             data_file_content=data_file_content,
-                             store_name=store_name,
-                             use_eng_name=use_eng_name)
-        else:
+        if not force_metadata and metadata_exist is None:
+            metadata_exist = is_metadata_complete(package_content=package_content)
+
+        if force_metadata or not metadata_exist:
             get_metadata(package_content=package_content,
                          resp=resp,
                          resp_int=resp_int,
@@ -833,7 +948,8 @@ def retrieve_info(package_list: Dict[str, str],
                          force_metadata=force_metadata,
                          data_file_content=data_file_content,
                          store_name=store_name,
-                         use_eng_name=use_eng_name)
+                         use_eng_name=use_eng_name,
+                         cache_path=cache_path)
 
         get_version(package_content=package_content,
                     package_and_version=package_and_version,
@@ -851,7 +967,7 @@ def retrieve_info(package_list: Dict[str, str],
 
         if not force_icons and icons_exist is None:
             icons_exist = is_icon_complete(package=package,
-                                           version_code=package_and_version[new_package][0],
+                                           version_code=version_code,
                                            repo_dir=repo_dir,
                                            data_file_content=data_file_content)
 
@@ -862,7 +978,7 @@ def retrieve_info(package_list: Dict[str, str],
             get_icon(resp_int=resp_int,
                      package=package,
                      new_package=new_package,
-                     version_code=package_and_version[new_package][0],
+                     version_code=version_code,
                      repo_dir=repo_dir,
                      force_icons=force_icons,
                      data_file_content=data_file_content,
@@ -897,67 +1013,120 @@ def retrieve_info(package_list: Dict[str, str],
     else:
         print(Fore.GREEN + "Nothing was processed, no files changed.")
 
-    if len(not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThese packages weren't found on any store:", end="\n\n")
-        for item in not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=not_found_packages, file_name="NotFound_Package", log_path=log_path)
-
-    if len(authorname_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe AuthorName for these packages wasn't found:", end="\n\n")
-        for item in authorname_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=authorname_not_found_packages, file_name="NotFound_AuthorName", log_path=log_path)
-
-    if len(authoremail_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe AuthorName for these packages wasn't found:", end="\n\n")
-        for item in authoremail_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=authoremail_not_found_packages, file_name="NotFound_AuthorEmail", log_path=log_path)
-
-    if len(website_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe Website for these packages wasn't found:", end="\n\n")
-        for item in website_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=website_not_found_packages, file_name="NotFound_Website", log_path=log_path)
-
-    if len(summary_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe Summary for these packages wasn't found:", end="\n\n")
-        for item in summary_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=summary_not_found_packages, file_name="NotFound_Summary", log_path=log_path)
-
-    if len(description_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe Description for these packages wasn't found:", end="\n\n")
-        for item in description_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=description_not_found_packages, file_name="NotFound_Description", log_path=log_path)
-
-    if len(category_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe Category for these packages wasn't found:", end="\n\n")
-        for item in category_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=category_not_found_packages, file_name="NotFound_Category", log_path=log_path)
-
-    if len(name_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe Name for these packages wasn't found:", end="\n\n")
-        for item in name_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=name_not_found_packages, file_name="NotFound_Name", log_path=log_path)
-
-    if len(icon_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe icon URL for these packages wasn't found:", end="\n\n")
-        for item in icon_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=icon_not_found_packages, file_name="NotFound_IconURL", log_path=log_path)
-
-    if len(screenshots_not_found_packages) != 0:
-        print(Fore.YELLOW + "\nThe screenshots URL for these packages weren't found:", end="\n\n")
-        for item in screenshots_not_found_packages:
-            print(Fore.YELLOW + item)
-        write_not_found_log(items=screenshots_not_found_packages,
-                            file_name="NotFound_ScreenshotsURL",
-                            log_path=log_path)
+    # All logs of a run share the same timestamp.
+    today_date = datetime.today().strftime("%Y%m%d_%H%M%S")
+
+    for items, file_name, message in ((not_found_packages,
+                                       "NotFound_Package",
+                                       "These packages weren't found on any store:"),
+                                      (authorname_not_found_packages,
+                                       "NotFound_AuthorName",
+                                       "The AuthorName for these packages wasn't found:"),
+                                      (authoremail_not_found_packages,
+                                       "NotFound_AuthorEmail",
+                                       "The AuthorEmail for these packages wasn't found:"),
+                                      (website_not_found_packages,
+                                       "NotFound_Website",
+                                       "The Website for these packages wasn't found:"),
+                                      (summary_not_found_packages,
+                                       "NotFound_Summary",
+                                       "The Summary for these packages wasn't found:"),
+                                      (description_not_found_packages,
+                                       "NotFound_Description",
+                                       "The Description for these packages wasn't found:"),
+                                      (category_not_found_packages,
+                                       "NotFound_Category",
+                                       "The Category for these packages wasn't found:"),
+                                      (name_not_found_packages,
+                                       "NotFound_Name",
+                                       "The Name for these packages wasn't found:"),
+                                      (icon_not_found_packages,
+                                       "NotFound_IconURL",
+                                       "The icon URL for these packages wasn't found:"),
+                                      (screenshots_not_found_packages,
+                                       "NotFound_ScreenshotsURL",
+                                       "The screenshots URL for these packages weren't found:")):
+        if len(items) == 0:
+            continue
+
+        print(Fore.YELLOW + "\n" + message, end="\n\n")
+        print(Fore.YELLOW + "\n".join(items))
+        write_not_found_log(items=items,
+                            file_name=file_name,
+                            log_path=log_path,
+                            today_date=today_date)
+
+
+def prefetch(function: Callable,
+             items: list,
+             max_workers: int) -> Iterator:
+    # Yield function(item) in the same order as items while the next calls already run in the background. Only a few
+    # results are kept ahead of the consumer so downloaded pages don't pile up in memory.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = deque()
+
+        for item in items:
+            futures.append(executor.submit(function, item))
+
+            if len(futures) > max_workers * 2:
+                yield futures.popleft().result()
+
+        while len(futures) != 0:
+            yield futures.popleft().result()
+
+
+def fetch_store_page(new_package: str,
+                     language: str,
+                     cookie_path: Optional[str],
+                     cache_path: Optional[str],
+                     refresh_cache: bool,
+                     data_file_content: dict) -> Tuple[Optional[str], list, List[str]]:
+    # Runs in a prefetch worker, the messages about the downloads are collected and returned instead of printed so
+    # they show up with the rest of the package's output and not while another package is being processed.
+    resp_list = []
+    messages = [Fore.GREEN + "\tDownloading Play Store page..."]
+
+    if get_play_store_page(new_package=new_package,
+                           resp_list=resp_list,
+                           messages=messages,
+                           language=language,
+                           cache_path=cache_path,
+                           refresh_cache=refresh_cache):
+        return "Play_Store", resp_list, messages
+
+    # Apps missing from the Play Store usually need both fallbacks, the Apkcombo page is downloaded in the background
+    # while the Amazon Appstore one is and only used if Amazon doesn't have the app. A finished Amazon download
+    # doesn't wait for the Apkcombo one.
+    amazon_resp_list = []
+    apkcombo_resp_list = []
+    apkcombo_messages = []
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    try:
+        apkcombo_future = executor.submit(get_apkcombo_page,
+                                          resp_list=apkcombo_resp_list,
+                                          messages=apkcombo_messages,
+                                          language=language,
+                                          new_package=new_package,
+                                          data_file_content=data_file_content)
+
+        messages.append(Fore.GREEN + "\tDownloading Amazon Appstore page...")
+        if get_amazon_page(resp_list=amazon_resp_list,
+                           messages=messages,
+                           language=language,
+                           new_package=new_package,
+                           cookie_path=cookie_path):
+            return "Amazon_Store", amazon_resp_list, messages
+
+        found_on_apkcombo = apkcombo_future.result()
+        messages.append(Fore.GREEN + "\tDownloading Apkcombo page...")
+        messages.extend(apkcombo_messages)
+        if found_on_apkcombo:
+            return "Apkcombo_Store", apkcombo_resp_list, messages
+    finally:
+        executor.shutdown(wait=False)
+
+    return None, [], messages
 
 
 def get_metadata(package_content: dict,
@@ -974,21 +1143,23 @@ def get_metadata(package_content: dict,
                  force_metadata: bool,
                  data_file_content: dict,
                  store_name: str,
-                 use_eng_name: bool) -> None:
-    author_name_pattern = data_file_content["Regex_Patterns"][store_name]["author_name_pattern"]
-    author_email_pattern = data_file_content["Regex_Patterns"][store_name]["author_email_pattern"]
-    name_pattern = data_file_content["Regex_Patterns"][store_name]["name_pattern"]
-    website_pattern = data_file_content["Regex_Patterns"][store_name]["website_pattern"]
-    category_pattern = data_file_content["Regex_Patterns"][store_name]["category_pattern"]
-    summary_pattern = data_file_content["Regex_Patterns"][store_name]["summary_pattern"]
-    summary_pattern_alt = data_file_content["Regex_Patterns"][store_name]["summary_pattern_alt"]
-    description_pattern = data_file_content["Regex_Patterns"][store_name]["description_pattern"]
-    gitlab_repo_id_pattern = data_file_content["Regex_Patterns"][store_name]["gitlab_repo_id_pattern"]
-    ads_pattern = data_file_content["Regex_Patterns"][store_name]["ads_pattern"]
-    inapp_purchases_pattern = data_file_content["Regex_Patterns"][store_name]["inapp_purchases_pattern"]
-    tracking_pattern = data_file_content["Regex_Patterns"][store_name]["tracking_pattern"]
-
-    if name_pattern != "":
+                 use_eng_name: bool,
+                 cache_path: Optional[str]) -> None:
+    store_patterns = data_file_content["Regex_Patterns"][store_name]  # type: Dict[str, Optional[re.Pattern]]
+    author_name_pattern = store_patterns["author_name_pattern"]
+    author_email_pattern = store_patterns["author_email_pattern"]
+    name_pattern = store_patterns["name_pattern"]
+    website_pattern = store_patterns["website_pattern"]
+    category_pattern = store_patterns["category_pattern"]
+    summary_pattern = store_patterns["summary_pattern"]
+    summary_pattern_alt = store_patterns["summary_pattern_alt"]
+    description_pattern = store_patterns["description_pattern"]
+    gitlab_repo_id_pattern = store_patterns["gitlab_repo_id_pattern"]
+    ads_pattern = store_patterns["ads_pattern"]
+    inapp_purchases_pattern = store_patterns["inapp_purchases_pattern"]
+    tracking_pattern = store_patterns["tracking_pattern"]
+
+    if name_pattern is not None:
         get_name(package_content=package_content,
                  name_pattern=name_pattern,
                  resp=resp,
@@ -998,7 +1169,7 @@ def get_metadata(package_content: dict,
                  force_metadata=force_metadata,
                  use_eng_name=use_eng_name)
 
-    if author_name_pattern != "":
+    if author_name_pattern is not None:
         get_author_name(package_content=package_content,
                         author_name_pattern=author_name_pattern,
                         resp=resp,
@@ -1006,7 +1177,7 @@ def get_metadata(package_content: dict,
                         authorname_not_found_packages=authorname_not_found_packages,
                         force_metadata=force_metadata)
 
-    if author_email_pattern != "":
+    if author_email_pattern is not None:
         get_author_email(package_content=package_content,
                          author_email_pattern=author_email_pattern,
                          resp=resp,
@@ -1016,7 +1187,7 @@ def get_metadata(package_content: dict,
 
     website = ""
 
-    if website_pattern != "":
+    if website_pattern is not None:
         website = get_website(package_content=package_content,
                               website_pattern=website_pattern,
                               resp=resp,
@@ -1028,9 +1199,10 @@ def get_metadata(package_content: dict,
                               gitlab_repo_id_pattern=gitlab_repo_id_pattern,
                               website=website,
                               data_file_content=data_file_content,
-                              force_metadata=force_metadata)
+                              force_metadata=force_metadata,
+                              cache_path=cache_path)
 
-    if category_pattern != "":
+    if category_pattern is not None:
         get_categories(package_content=package_content,
                        category_pattern=category_pattern,
                        resp_int=resp_int,
@@ -1040,8 +1212,8 @@ def get_metadata(package_content: dict,
                        force_metadata=force_metadata,
                        store_name=store_name)
 
-    if summary_pattern != "":
-        if package_content.get("Summary", "") == "" or package_content.get("Summary") is None or force_metadata:
+    if summary_pattern is not None:
+        if needs_value(package_content=package_content, field_name="Summary", force=force_metadata):
             if not get_summary(resp=resp,
                                package_content=package_content,
                                pattern=summary_pattern):
@@ -1051,7 +1223,7 @@ def get_metadata(package_content: dict,
                     print(Fore.YELLOW + "\tWARNING: Couldn't get the summary.", end="\n\n")
                     summary_not_found_packages.append(package)
 
-    if description_pattern != "":
+    if description_pattern is not None:
         get_description(package_content=package_content,
                         description_pattern=description_pattern,
                         resp=resp,
@@ -1072,72 +1244,73 @@ def get_anti_features(package_content: dict,
                       website: str,
                       resp_int: str,
                       force_metadata: bool,
-                      ads_pattern: str,
-                      inapp_purchases_pattern: str,
-                      tracking_pattern: str) -> None:
+                      ads_pattern: Optional[Union[str, re.Pattern]],
+                      inapp_purchases_pattern: Optional[Union[str, re.Pattern]],
+                      tracking_pattern: Optional[Union[str, re.Pattern]]) -> None:
 
-    if (package_content.get("AntiFeatures", "") == "" or package_content.get("AntiFeatures") is None
-            or None in package_content.get("AntiFeatures") or force_metadata):
-        if ("github.com/" or "gitlab.com/") in website:
+    if (needs_value(package_content=package_content, field_name="AntiFeatures", force=force_metadata)
+            or None in package_content["AntiFeatures"]):
+        if split_repo_url(website=website)[0] in SOURCE_CODE_HOSTS:
             anti_features = ["NonFreeAssets"]
         else:
             anti_features = ["UpstreamNonFree", "NonFreeAssets"]
 
-        if ads_pattern != "":
-            if re.search(ads_pattern, resp_int) is not None:
+        if ads_pattern is not None:
+            if contains_marker(marker=ads_pattern, page=resp_int):
                 anti_features.append("Ads")
 
-        if tracking_pattern != "":
-            if re.search(tracking_pattern, resp_int) is not None:
+        if tracking_pattern is not None:
+            if contains_marker(marker=tracking_pattern, page=resp_int):
                 anti_features.append("Tracking")
 
-        if inapp_purchases_pattern != "":
-            if re.search(inapp_purchases_pattern, resp_int) is not None:
+        if inapp_purchases_pattern is not None:
+            if contains_marker(marker=inapp_purchases_pattern, page=resp_int):
                 anti_features.append("NonFreeDep")
                 anti_features.append("NonFreeNet")
 
         package_content["AntiFeatures"] = anti_features
 
 
+def contains_marker(marker: Union[str, re.Pattern],
+                    page: str) -> bool:
+    if isinstance(marker, str):
+        return marker in page
+    else:
+        return marker.search(page) is not None
+
+
 def get_author_email(package_content: dict,
-                     author_email_pattern: str,
+                     author_email_pattern: re.Pattern,
                      resp: str,
                      package: str,
                      authoremail_not_found_packages: list,
                      force_metadata: bool) -> None:
-    if package_content.get("AuthorEmail", "") == "" or package_content.get("AuthorEmail") is None or force_metadata:
-        try:
-            email_grps = re.findall(author_email_pattern, resp)
-
-            for item in email_grps:
-                if "@" not in item:
-                    continue
-                else:
-                    package_content["AuthorEmail"] = item
-                    break
-        except (IndexError, AttributeError):
+    if needs_value(package_content=package_content, field_name="AuthorEmail", force=force_metadata):
+        # Stop at the first match that looks like an email instead of collecting every match in the page.
+        email_group = 1 if author_email_pattern.groups != 0 else 0
+
+        for email_match in author_email_pattern.finditer(resp):
+            item = email_match.group(email_group)
+            if "@" in item:
+                package_content["AuthorEmail"] = item
+                break
+        else:
             print(Fore.YELLOW + "\tWARNING: Couldn't get the Author email.", end="\n\n")
             authoremail_not_found_packages.append(package)
 
 
 def get_description(package_content: dict,
-                    description_pattern: str,
+                    description_pattern: re.Pattern,
                     resp: str,
                     package: str,
                     description_not_found_packages: list,
                     force_metadata: bool) -> None:
-    if package_content.get("Description", "") == "" or package_content.get("Description") is None or force_metadata:
+    if needs_value(package_content=package_content, field_name="Description", force=force_metadata):
         try:
-            description_extracted = html.unescape(re.search(description_pattern, resp).group(1))
-            description_extracted = description_extracted.replace("<br>", "\n").replace("<br />", "\n").strip()
-
-            description = ""
-            for line in description_extracted.splitlines():
-                if description == "":
-                    description += line.strip()
-                else:
-                    description += "\n" + line.strip()
+            description_extracted = html.unescape(description_pattern.search(resp).group(1))
+            description_extracted = BR_TAG_PATTERN.sub("\n", description_extracted).strip()
 
+            description = "\n".join(line.strip() for line in description_extracted.splitlines())
         except (IndexError, AttributeError):
             print(Fore.YELLOW + "\tWARNING: Couldn't get the description.", end="\n\n")
             description_not_found_packages.append(package)
@@ -1147,14 +1320,14 @@ def get_description(package_content: dict,
 
 
 def get_name(package_content: dict,
-             name_pattern: str,
+             name_pattern: re.Pattern,
              resp: str,
              resp_int: str,
              package: str,
              name_not_found_packages: list,
              force_metadata: bool,
              use_eng_name: bool) -> None:
-    if package_content.get("Name", "") == "" or package_content.get("Name") is None or force_metadata:
+    if needs_value(package_content=package_content, field_name="Name", force=force_metadata):
 
         if use_eng_name:
             resp_final = resp_int
@@ -1162,14 +1335,14 @@ def get_name(package_content: dict,
             resp_final = resp
 
         try:
-            package_content["Name"] = html.unescape(re.search(name_pattern, resp_final).group(1)).strip()
+            package_content["Name"] = html.unescape(name_pattern.search(resp_final).group(1)).strip()
         except (IndexError, AttributeError):
             print(Fore.YELLOW + "\tWARNING: Couldn't get the application name.", end="\n\n")
             name_not_found_packages.append(package)
 
 
 def get_categories(package_content: dict,
-                   category_pattern: str,
+                   category_pattern: re.Pattern,
                    resp_int: str,
                    package: str,
                    category_not_found_packages: list,
@@ -1180,11 +1353,12 @@ def get_categories(package_content: dict,
         # Amazon Appstore doesn't show the app's categories in the app page.
         return
 
-    if (package_content.get("Categories", "") == "" or
-            package_content.get("Categories", "") == ["fdroid_repo"] or
-            package_content.get("Categories") is None or
-            None in package_content.get("Categories") or force_metadata):
-        ret_grp = re.search(category_pattern, resp_int)
+    if (needs_value(package_content=package_content,
+                    field_name="Categories",
+                    force=force_metadata,
+                    unset_values=(None, "", ["fdroid_repo"]))
+            or None in package_content["Categories"]):
+        ret_grp = category_pattern.search(resp_int)
 
         if ret_grp is not None:
             cat_list = extract_categories(ret_grp=ret_grp,
@@ -1207,30 +1381,35 @@ def extract_categories(ret_grp: re.Match,
                        store_name: str) -> Optional[list]:
 
     sport_category_pattern = data_file_content["Sport_Category_Pattern"][store_name]
+    game_categories = data_file_content["Game_Categories"]  # type: Dict[str, str]
+    app_categories = data_file_content["App_Categories"]  # type: Dict[str, str]
 
     cat_list = []
 
     for cat in ret_grp.groups():
-        if html.unescape(cat).strip() == "Sports":
-            if (sport_category_pattern is not None
-                    and sport_category_pattern != ""
-                    and resp_int.find(sport_category_pattern)):
-                cat_list.append(data_file_content["Game_Categories"][html.unescape(cat).strip()])
-            elif data_file_content["App_Categories"][html.unescape(cat).strip()] != "":
-                cat_list.append(data_file_content["App_Categories"][html.unescape(cat).strip()])
-            else:
-                cat_list.append(html.unescape(cat).strip())
+        if cat is None:
             continue
 
-        if cat.strip() != "" and html.unescape(cat).strip() in data_file_content["Game_Categories"].keys():
-            cat_list.append(data_file_content["Game_Categories"][html.unescape(cat).strip()])
+        cat = html.unescape(cat).strip()
+        if cat == "":
             continue
 
-        if cat.strip() != "" and html.unescape(cat).strip() in data_file_content["App_Categories"].keys():
-            if data_file_content["App_Categories"][html.unescape(cat).strip()] != "":
-                cat_list.append(data_file_content["App_Categories"][html.unescape(cat).strip()])
+        game_category = game_categories.get(cat)
+        app_category = app_categories.get(cat)
+
+        # "Sports" is both an app and a game category, only the page's link to the sport games category tells them
+        # apart.
+        if cat == "Sports":
+            if sport_category_pattern and sport_category_pattern in resp_int and game_category is not None:
+                cat_list.append(game_category)
             else:
-                cat_list.append(html.unescape(cat).strip())
+                cat_list.append(app_category or cat)
+            continue
+
+        if game_category is not None:
+            cat_list.append(game_category)
+        elif app_category is not None:
+            cat_list.append(app_category or cat)
 
     if len(cat_list) == 0:
         return None
@@ -1239,59 +1418,78 @@ def extract_categories(ret_grp: re.Match,
 
 
 def get_repo_info_and_license(package_content: dict,
-                              gitlab_repo_id_pattern: str,
+                              gitlab_repo_id_pattern: Optional[re.Pattern],
                               website: str,
                               data_file_content: dict,
-                              force_metadata: bool) -> None:
-    if "https://github.com/" in website or "http://github.com/" in website:
-        repo = re.sub(r"(https?)(://github.com/[^/]+/[^/]+).*", r"https\2", website)
-        api_repo = re.sub(r"(https?)(://github.com/)([^/]+/[^/]+).*",
-                          r"https://api.github.com/repos/\3", website)
+                              force_metadata: bool,
+                              cache_path: Optional[str]) -> None:
+    repo_host, repo_path = split_repo_url(website=website)
 
-        get_license(package_content, force_metadata, api_repo, data_file_content)
+    if repo_host == "github.com":
+        repo = "https://github.com/" + repo_path
+        api_repo = "https://api.github.com/repos/" + repo_path
+
+        get_license(package_content=package_content,
+                    force_metadata=force_metadata,
+                    api_repo=api_repo,
+                    data_file_content=data_file_content,
+                    cache_path=cache_path)
 
-        if (package_content.get("IssueTracker", "") == "" or package_content.get("IssueTracker") is None
-                or force_metadata):
+        if needs_value(package_content=package_content, field_name="IssueTracker", force=force_metadata):
             package_content["IssueTracker"] = repo + "/issues"
 
-        if package_content.get("SourceCode", "") == "" or package_content.get("SourceCode") is None or force_metadata:
+        if needs_value(package_content=package_content, field_name="SourceCode", force=force_metadata):
             package_content["SourceCode"] = repo
 
-        if package_content.get("Changelog", "") == "" or package_content.get("Changelog") is None or force_metadata:
+        if needs_value(package_content=package_content, field_name="Changelog", force=force_metadata):
             package_content["Changelog"] = repo + "/releases/latest"
 
-        if package_content.get("Repo", "") == "" or package_content.get("Repo") is None or force_metadata:
+        if needs_value(package_content=package_content, field_name="Repo", force=force_metadata):
             package_content["Repo"] = repo
-    elif "https://gitlab.com/" in website or "http://gitlab.com/" in website:
-        repo = re.sub(r"(https?)(://gitlab.com/[^/]+/[^/]+).*", r"https\2", website)
-        git_repo = urllib.request.urlopen(repo).read().decode()
-
-        try:
-            repo_id = re.search(gitlab_repo_id_pattern, git_repo).groups(1)
-            api_repo = "https://gitlab.com/api/v4/projects/" + repo_id[0].strip() + "?license=yes"
-            get_license(package_content, force_metadata, api_repo, data_file_content)
-        except (IndexError, AttributeError):
-            pass
+    elif repo_host == "gitlab.com":
+        repo = "https://gitlab.com/" + repo_path
+
+        # The repository page is only needed for the project ID used in the license lookup.
+        if gitlab_repo_id_pattern is not None and needs_value(package_content=package_content,
+                                                              field_name="License",
+                                                              force=force_metadata,
+                                                              unset_values=(None, "", "Unknown")):
+            try:
+                git_repo = download_page(url=repo,
+                                         cache_path=cache_path,
+                                         refresh_cache=force_metadata)
+                repo_id = gitlab_repo_id_pattern.search(git_repo).groups(1)
+                api_repo = "https://gitlab.com/api/v4/projects/" + repo_id[0].strip() + "?license=yes"
+                get_license(package_content=package_content,
+                            force_metadata=force_metadata,
+                            api_repo=api_repo,
+                            data_file_content=data_file_content,
+                            cache_path=cache_path)
+            except requests.RequestException:
+                print(Fore.YELLOW + "\tCouldn't download the GitLab repository page for the license.", end="\n\n")
+            except (IndexError, AttributeError):
+                pass
 
-        if (package_content.get("IssueTracker", "") == "" or package_content.get("IssueTracker") is None
-                or force_metadata):
+        if needs_value(package_content=package_content, field_name="IssueTracker", force=force_metadata):
             package_content["IssueTracker"] = repo + "/-/issues"
 
-        if package_content.get("SourceCode", "") == "" or package_content.get("SourceCode") is None or force_metadata:
+        if needs_value(package_content=package_content, field_name="SourceCode", force=force_metadata):
             package_content["SourceCode"] = repo
 
-        if package_content.get("Changelog", "") == "" or package_content.get("Changelog") is None or force_metadata:
+        if needs_value(package_content=package_content, field_name="Changelog", force=force_metadata):
             package_content["Changelog"] = repo + "/-/releases"
 
-        if package_content.get("Repo", "") == "" or package_content.get("Repo") is None or force_metadata:
+        if needs_value(package_content=package_content, field_name="Repo", force=force_metadata):
             package_content["Repo"] = repo
-    elif (package_content.get("License", "") == "" or package_content.get("License", "") == "Unknown"
-          or package_content.get("License") is None or force_metadata):
+    elif needs_value(package_content=package_content,
+                     field_name="License",
+                     force=force_metadata,
+                     unset_values=(None, "", "Unknown")):
         package_content["License"] = "Copyright"
 
 
 def get_website(package_content: dict,
-                website_pattern: str,
+                website_pattern: re.Pattern,
                 resp: str,
                 package: str,
                 website_not_found_packages: list,
@@ -1299,27 +1497,26 @@ def get_website(package_content: dict,
     website = ""
 
     try:
-        website = (re.search(website_pattern, resp).group(1).strip())
+        website = (website_pattern.search(resp).group(1).strip())
     except (IndexError, AttributeError):
         print(Fore.YELLOW + "\tWARNING: Couldn't get the app website.", end="\n\n")
         website_not_found_packages.append(package)
 
-    if website != "" and (package_content.get("WebSite", "") == "" or package_content.get("WebSite") is None
-                          or force_metadata):
+    if website != "" and needs_value(package_content=package_content, field_name="WebSite", force=force_metadata):
         package_content["WebSite"] = website.replace("http://", "https://")
 
     return website
 
 
 def get_author_name(package_content: dict,
-                    author_name_pattern: str,
+                    author_name_pattern: re.Pattern,
                     resp: str,
                     package: str,
                     authorname_not_found_packages: list,
                     force_metadata: bool) -> None:
     try:
-        if package_content.get("AuthorName", "") == "" or package_content.get("AuthorName") is None or force_metadata:
-            package_content["AuthorName"] = html.unescape(re.search(author_name_pattern, resp).group(1)).strip()
+        if needs_value(package_content=package_content, field_name="AuthorName", force=force_metadata):
+            package_content["AuthorName"] = html.unescape(author_name_pattern.search(resp).group(1)).strip()
     except (IndexError, AttributeError):
         print(Fore.YELLOW + "\tWARNING: Couldn't get the Author name.", end="\n\n")
         authorname_not_found_packages.append(package)
@@ -1327,49 +1524,203 @@ def get_author_name(package_content: dict,
 
 def get_play_store_page(new_package: str,
                         resp_list: list,
-                        language: str) -> bool:
+                        messages: List[str],
+                        language: str,
+                        cache_path: Optional[str] = None,
+                        refresh_cache: bool = False) -> bool:
 
     playstore_url = "https://play.google.com/store/apps/details?id="
 
     playstore_url_comp_int = playstore_url + new_package + "&hl=en-US"
     playstore_url_comp = playstore_url + new_package + "&hl=" + language
 
-    try:
-        resp_list.append(urllib.request.urlopen(playstore_url_comp).read().decode())
-    except HTTPError as e:
-        if e.code == 404:
-            print(Fore.YELLOW + "\t{} was not found on the Play Store.".format(new_package), end="\n\n")
-        return False
-
-    if playstore_url_comp == playstore_url_comp_int:
-        resp_list.append(resp_list[0])
+    # Both variants are independent, the en-US page is downloaded in the background while the localized one is.
+    if playstore_url_comp != playstore_url_comp_int:
+        resp_int_future = BACKGROUND_DOWNLOADS.submit(download_page,
+                                                      url=playstore_url_comp_int,
+                                                      cache_path=cache_path,
+                                                      refresh_cache=refresh_cache)
     else:
+        resp_int_future = None
+
+    try:
         try:
-            resp_list.append(urllib.request.urlopen(playstore_url_comp_int).read().decode())
-        except HTTPError as e:
-            if e.code == 404:
-                print(Fore.YELLOW + "\t{} was not found on the Play Store (en-US).".format(new_package), end="\n\n")
+            resp_list.append(download_page(url=playstore_url_comp,
+                                           cache_path=cache_path,
+                                           refresh_cache=refresh_cache))
+        except requests.HTTPError as e:
+            if e.response.status_code == 404:
+                messages.append(Fore.YELLOW + "\t{} was not found on the Play Store.".format(new_package))
+            return False
+        except requests.RequestException:
+            messages.append(Fore.YELLOW + "\tCouldn't download the Play Store page for {}.".format(new_package))
             return False
 
+        if resp_int_future is None:
+            resp_list.append(resp_list[0])
+        else:
+            try:
+                resp_list.append(resp_int_future.result())
+            except requests.HTTPError as e:
+                if e.response.status_code == 404:
+                    messages.append(Fore.YELLOW + "\t{} was not found on the Play Store (en-US).".format(new_package))
+                return False
+            except requests.RequestException:
+                messages.append(Fore.YELLOW + "\tCouldn't download the Play Store page for {} (en-US).".format(
+                    new_package))
+                return False
+    finally:
+        # An early return doesn't wait for the background download, it's dropped if it hasn't started yet.
+        if resp_int_future is not None:
+            resp_int_future.cancel()
+
     if ">We're sorry, the requested URL was not found on this server.</div>" in resp_list[1]:
-        print(Fore.YELLOW + "\t{} was not found on the Play Store.".format(new_package), end="\n\n")
+        messages.append(Fore.YELLOW + "\t{} was not found on the Play Store.".format(new_package))
         return False
 
     return True
 
 
+def download_page(url: str,
+                  cache_path: Optional[str] = None,
+                  refresh_cache: bool = False,
+                  headers: Optional[Dict[str, str]] = None) -> str:
+    # With a cache_path pages newer than PAGE_CACHE_MAX_AGE are reused without any request, older ones are revalidated
+    # using the stored ETag/Last-Modified values and only downloaded again if they changed.
+    # The response is closed right away instead of waiting for the garbage collector so the connection goes back to
+    # the session's pool before the page is processed.
+    if cache_path is None:
+        with http_session() as session, session.get(url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            return decode_response(response=response)
+
+    cache_key = hashlib.sha1(url.encode("utf_8")).hexdigest()
+    page_path = os.path.join(cache_path, cache_key + ".html")
+    info_path = os.path.join(cache_path, cache_key + ".json")
+
+    headers = dict(headers or {})
+
+    if not refresh_cache and os.path.isfile(page_path):
+        if time.time() - os.path.getmtime(page_path) < PAGE_CACHE_MAX_AGE:
+            return read_cached_page(page_path=page_path)
+
+        cache_info = load_cache_info(info_path=info_path)
+
+        if cache_info.get("ETag") is not None:
+            headers["If-None-Match"] = cache_info["ETag"]
+        if cache_info.get("Last-Modified") is not None:
+            headers["If-Modified-Since"] = cache_info["Last-Modified"]
+
+    with http_session() as session, session.get(url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+        if response.status_code == 304:
+            # Not modified, refresh the cached page's age so it isn't revalidated again until it expires.
+            os.utime(page_path)
+            return read_cached_page(page_path=page_path)
+
+        response.raise_for_status()
+        page = decode_response(response=response)
+        cache_info = {"ETag": response.headers.get("ETag"),
+                      "Last-Modified": response.headers.get("Last-Modified")}
+
+    try:
+        write_cache_file(file_path=page_path, content=page)
+        write_cache_file(file_path=info_path, content=json.dumps(cache_info))
+    except OSError as e:
+        # Without matching validators the page is downloaded again the next time it's revalidated.
+        with contextlib.suppress(OSError):
+            os.remove(info_path)
+        print(Fore.YELLOW + "\tWARNING: Couldn't write the page to the cache directory.")
+        print(Fore.YELLOW + "\t" + str(e), end="\n\n")
+
+    return page
+
+
+def write_cache_file(file_path: str,
+                     content: str) -> None:
+    # Written to a temporary file first and moved in place, an interrupted run or another download of the same URL
+    # never leaves a truncated file behind.
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+
+    try:
+        with open(file_descriptor, "w", encoding="utf_8") as file_stream:
+            file_stream.write(content)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+@contextlib.contextmanager
+def http_session() -> Iterator[requests.Session]:
+    try:
+        session = HTTP_SESSIONS.get_nowait()
+    except queue.Empty:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+
+    try:
+        yield session
+    finally:
+        # Only the connections are shared, cookies set by one site don't follow to the next download.
+        session.cookies.clear()
+        HTTP_SESSIONS.put(session)
+
+
+def decode_response(response: requests.Response) -> str:
+    # requests falls back to ISO-8859-1 for text without a declared charset, pages are expected to be UTF-8.
+    if "charset=" in response.headers.get("Content-Type", "").lower():
+        encoding = response.encoding
+    else:
+        encoding = "utf_8"
+
+    return response.content.decode(encoding, errors="replace")
+
+
+def download_file(url: str,
+                  file_path: str) -> None:
+    with http_session() as session, session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        try:
+            with open(file_path, "wb") as file_stream:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file_stream.write(chunk)
+        except BaseException:
+            # A download cut off halfway would otherwise be taken for a complete file on the next run.
+            with contextlib.suppress(OSError):
+                os.remove(file_path)
+            raise
+
+
+def read_cached_page(page_path: str) -> str:
+    with open(page_path, "r", encoding="utf_8") as page_stream:
+        return page_stream.read()
+
+
+def load_cache_info(info_path: str) -> Dict[str, Optional[str]]:
+    try:
+        with open(info_path, "r", encoding="utf_8") as info_stream:
+            return json.load(info_stream)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
 def get_summary(resp: str,
                 package_content: dict,
-                pattern: str) -> bool:
+                pattern: Optional[re.Pattern]) -> bool:
     try:
-        summary = html.unescape(re.search(pattern, resp).group(1)).strip()
-        summary = re.sub(r"(<[^>]+>)", "", summary).strip()
-
-        while len(summary) > 80:
-            try:
-                summary = re.search(r"(^.+)\.\s+.+$", summary).group(1)
-            except (IndexError, AttributeError):
-                summary = re.search(r"^(.+)\s\S+\s*$", summary[:77]).group(1) + "..."
+        summary = html.unescape(pattern.search(resp).group(1)).strip()
+        summary = HTML_TAG_PATTERN.sub("", summary).strip()
+
+        # Keep the sentences that fit in 80 characters, if the first sentence is already too long cut it at the last
+        # full word.
+        if len(summary) > 80:
+            # A sentence ends at a period followed by any whitespace, the last one whose text still fits is used.
+            sentence_ends = [match.start() for match in SENTENCE_END_PATTERN.finditer(summary, 1, 82)]
+            if len(sentence_ends) != 0:
+                summary = summary[:sentence_ends[-1]]
+            else:
+                summary = summary[:77].rstrip().rsplit(maxsplit=1)[0] + "..."
 
         package_content["Summary"] = summary.strip()
 
@@ -1378,15 +1729,45 @@ def get_summary(resp: str,
         return False
 
 
+def split_repo_url(website: str) -> Tuple[str, str]:
+    # Host and the first two path components ("owner/project" on GitHub and GitLab) of the website, empty strings if
+    # it doesn't have them.
+    url = urllib.parse.urlsplit(website.strip())
+    path_parts = url.path.split("/", 3)
+
+    if url.scheme not in ("http", "https") or len(path_parts) < 3 or path_parts[1] == "" or path_parts[2] == "":
+        return "", ""
+
+    return url.netloc.lower(), path_parts[1] + "/" + path_parts[2]
+
+
 def get_license(package_content: dict,
                 force_metadata: bool,
                 api_repo: str,
-                data_file_content: dict) -> None:
-    if (package_content.get("License", "") == "" or package_content.get("License", "") == "Unknown"
-            or package_content.get("License") is None or force_metadata):
+                data_file_content: dict,
+                cache_path: Optional[str]) -> None:
+    if needs_value(package_content=package_content,
+                   field_name="License",
+                   force=force_metadata,
+                   unset_values=(None, "", "Unknown")):
+        if api_repo in REPO_LICENSES:
+            package_content["License"] = REPO_LICENSES[api_repo]
+            return
+
+        # Unauthenticated GitHub API calls are limited to 60 per hour, a token raises the limit. Cached responses are
+        # revalidated with conditional requests which don't count against it.
+        if api_repo.startswith("https://api.github.com/") and os.environ.get("GITHUB_TOKEN"):
+            headers = {"Accept": "application/vnd.github+json",
+                       "Authorization": "Bearer " + os.environ["GITHUB_TOKEN"]}
+        else:
+            headers = None
+
         try:
-            api_load = urllib.request.urlopen(api_repo).read().decode()
-        except HTTPError:
+            api_load = download_page(url=api_repo,
+                                     cache_path=cache_path,
+                                     refresh_cache=force_metadata,
+                                     headers=headers)
+        except requests.RequestException:
             print(Fore.YELLOW + "\tCouldn't download the api response for the license.", end="\n\n")
             return
 
@@ -1401,17 +1782,18 @@ def get_license(package_content: dict,
         else:
             package_content["License"] = "No License"
 
+        REPO_LICENSES[api_repo] = package_content["License"]
+
 
 def normalize_license(data_file_content: dict,
                       license_key: str) -> str:
-    license_dict = {}
-    for key in data_file_content["Licenses"]:
-        license_dict[key.lower().strip()] = key
-
-    if license_key.lower().strip() in license_dict.keys():
-        return license_dict[license_key.lower().strip()]
-    elif license_key.lower().strip() + "-only" in license_dict.keys():
-        return license_dict[license_key.lower().strip() + "-only"]
+    license_dict = data_file_content["Licenses"]  # type: Dict[str, str]
+    license_key = license_key.lower().strip()
+
+    if license_key in license_dict:
+        return license_dict[license_key]
+    elif license_key + "-only" in license_dict:
+        return license_dict[license_key + "-only"]
     else:
         return "Other"
 
@@ -1429,13 +1811,13 @@ def get_screenshots(resp: str,
     screenshots_path = os.path.join(repo_dir, package, "en-US", "phoneScreenshots")
     backup_path = os.path.join(repo_dir, "backup", package, "en-US", "phoneScreenshots")
 
-    if os.path.exists(screenshots_path) and ".noscreenshots" in os.listdir(screenshots_path):
+    if os.path.exists(os.path.join(screenshots_path, ".noscreenshots")):
         print(Fore.BLUE + "\tSkipping screenshots download for {}.".format(package), end="\n\n")
         return
 
     screenshot_pattern = data_file_content["Regex_Patterns"][store_name]["screenshot_pattern"]
 
-    if screenshot_pattern == "":
+    if screenshot_pattern is None:
         return
 
     print(Fore.GREEN + "\tDownloading screenshots for {}...".format(package), end="\n\n")
@@ -1444,15 +1826,15 @@ def get_screenshots(resp: str,
         screenshot_pattern_alt = data_file_content["Regex_Patterns"][store_name]["screenshot_pattern_alt"]
 
         try:
-            scrn_div = re.search(screenshot_pattern, resp).group(1)
+            scrn_div = screenshot_pattern.search(resp).group(1)
         except (AttributeError, IndexError):
             print(Fore.YELLOW + "\tCouldn't get screenshots URLs for {}".format(new_package), end="\n\n")
             screenshots_not_found_packages.append(package)
             return
 
-        img_url_list = re.findall(screenshot_pattern_alt, scrn_div)
+        img_url_list = screenshot_pattern_alt.findall(scrn_div)
     else:
-        img_url_list = re.findall(screenshot_pattern, resp)  # type: List[str]
+        img_url_list = screenshot_pattern.findall(resp)  # type: List[str]
 
     if len(img_url_list) == 0:
         print(Fore.YELLOW + "\tCouldn't get screenshots URLs for {}".format(new_package), end="\n\n")
@@ -1484,41 +1866,69 @@ def get_screenshots(resp: str,
             print(Fore.RED + "\tCouldn't move the screenshots to the backup directory. Permission denied.", end="\n\n")
             return
 
+    # Screenshots are downloaded to a temporary directory first and only the successful ones are moved in place,
+    # numbered consecutively in their original order, so failed downloads never leave gaps or stray files behind.
     try:
-        os.makedirs(screenshots_path)
-    except FileExistsError:
-        pass
+        os.makedirs(screenshots_path, exist_ok=True)
+        download_dir = tempfile.mkdtemp(prefix=".download-", dir=screenshots_path)
     except PermissionError:
         print(Fore.RED + "\tError creating the directory where the screenshots should be saved. Permission denied.",
               end="\n\n")
         return
 
-    pad_amount = len(str(len(img_url_list)))
+    try:
+        download_paths = [os.path.join(download_dir, str(i) + ".png") for i in range(len(img_url_list))]
 
-    i = 0
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            futures = []
 
-    for img_url in img_url_list:
-        if store_name == "Play_Store" or store_name == "Apkcombo_Store":
-            url = img_url + "=w9999"
-        else:
-            url = img_url
-        ss_path = os.path.join(screenshots_path, str(i).zfill(pad_amount) + ".png")
-        try:
-            urllib.request.urlretrieve(url, ss_path)
-            i += 1
-        except HTTPError:
-            pass
-        except PermissionError:
-            print(Fore.RED + "\tError downloading screenshots. Permission denied.", end="\n\n")
-            return
+            for img_url, download_path in zip(img_url_list, download_paths):
+                if store_name == "Play_Store" or store_name == "Apkcombo_Store":
+                    url = img_url + "=w9999"
+                else:
+                    url = img_url
+                futures.append(executor.submit(download_file, url=url, file_path=download_path))
+
+        downloaded_paths = []
+
+        for future, download_path in zip(futures, download_paths):
+            try:
+                future.result()
+            except requests.RequestException:
+                continue
+            except PermissionError:
+                print(Fore.RED + "\tError downloading screenshots. Permission denied.", end="\n\n")
+                return
+
+            downloaded_paths.append(download_path)
+
+        pad_amount = len(str(len(img_url_list)))
+
+        for i, download_path in enumerate(downloaded_paths):
+            try:
+                os.replace(download_path, os.path.join(screenshots_path, str(i).zfill(pad_amount) + ".png"))
+            except OSError:
+                print(Fore.RED + "\tError downloading screenshots. Permission denied.", end="\n\n")
+                return
+    finally:
+        shutil.rmtree(download_dir, ignore_errors=True)
 
     print(Fore.GREEN + "\tFinished downloading screenshots for {}.".format(package), end="\n\n")
 
 
+def ensure_dir(dir_path: str) -> None:
+    # The icon directories are the same for every package, only check them the first time.
+    if dir_path in CREATED_DIRS:
+        return
+
+    os.makedirs(dir_path, exist_ok=True)
+    CREATED_DIRS.add(dir_path)
+
+
 def extract_icon_url(resp_int: str,
-                     icon_pattern: str) -> Optional[str]:
+                     icon_pattern: re.Pattern) -> Optional[str]:
     try:
-        icon_base_url = re.search(icon_pattern, resp_int).group(1)
+        icon_base_url = icon_pattern.search(resp_int).group(1)
     except (IndexError, AttributeError):
         return None
 
@@ -1529,9 +1939,9 @@ def extract_icon_url(resp_int: str,
 
 
 def extract_icon_url_alt(resp_int: str,
-                         icon_pattern_alt: str) -> Optional[str]:
+                         icon_pattern_alt: re.Pattern) -> Optional[str]:
     try:
-        icon_base_url_alt = re.search(icon_pattern_alt, resp_int).group(1)
+        icon_base_url_alt = icon_pattern_alt.search(resp_int).group(1)
     except (IndexError, AttributeError):
         return None
 
@@ -1553,7 +1963,7 @@ def get_icon(resp_int: str,
     icon_pattern = data_file_content["Regex_Patterns"][store_name]["icon_pattern"]
     icon_pattern_alt = data_file_content["Regex_Patterns"][store_name]["icon_pattern_alt"]
 
-    if icon_pattern == "":
+    if icon_pattern is None:
         return
 
     if version_code is None or version_code == 0:
@@ -1568,7 +1978,7 @@ def get_icon(resp_int: str,
     icon_base_url = extract_icon_url(resp_int, icon_pattern)
 
     if icon_base_url is None:
-        if icon_pattern_alt == "":
+        if icon_pattern_alt is None:
             print(Fore.YELLOW + "\tCouldn't extract icon URL for {}.".format(new_package), end="\n\n")
             icon_not_found_packages.append(package)
             return
@@ -1583,144 +1993,111 @@ def get_icon(resp_int: str,
 
     for dirname in data_file_content["Icon_Relations"].keys():
         try:
-            os.makedirs(os.path.join(repo_dir, dirname))
-        except FileExistsError:
-            pass
+            ensure_dir(dir_path=os.path.join(repo_dir, dirname))
         except PermissionError:
             print(Fore.RED + "\tERROR: Can't create directory for \"" + dirname +
                   "\". Permission denied, skipping icon download for this package.", end="\n\n")
             icon_not_found_packages.append(package)
             return
 
+    icon_paths = get_missing_icon_paths(repo_dir=repo_dir,
+                                        filename=filename,
+                                        force_icons=force_icons,
+                                        data_file_content=data_file_content)
+    icon_sizes = data_file_content["Icon_Relations"]  # type: Dict[str, str]
+
     if icon_base_url is not None:
         if store_name == "Play_Store" or store_name == "Apkcombo_Store":
-            for dirname in data_file_content["Icon_Relations"].keys():
-                icon_path = os.path.join(repo_dir, dirname, filename)
+            download_icons(icon_downloads=[(dirname, icon_base_url + icon_sizes[dirname], icon_path)
+                                           for dirname, icon_path in icon_paths.items()])
+        elif store_name == "Amazon_Store":
+            # Only a single icon is available, it's downloaded and decoded once and then resized for every density.
+            if len(icon_paths) == 0:
+                return
 
-                if os.path.exists(icon_path) and not force_icons:
-                    continue
+            first_dirname = next(iter(icon_paths))
+            main_icon_path = os.path.join(tempfile.mkdtemp(), filename)
 
-                url = icon_base_url + data_file_content["Icon_Relations"][dirname]
+            try:
+                download_file(url=icon_base_url, file_path=main_icon_path)
+            except requests.RequestException:
+                print(Fore.YELLOW + "\tCouldn't download icon for {}.".format(first_dirname))
+                return
+            except PermissionError:
+                print(Fore.YELLOW + "\tCouldn't write icon file for {}. Permission denied.".format(first_dirname))
+                return
 
-                try:
-                    urllib.request.urlretrieve(url, icon_path)
-                except urllib.error.HTTPError:
-                    print(Fore.YELLOW + "\tCouldn't download icon for {}.".format(dirname))
-                except PermissionError:
-                    print(Fore.YELLOW + "\tCouldn't write icon file for {}. Permission denied.".format(dirname))
-                    return
-        elif store_name == "Amazon_Store":
+            from PIL import Image
+            # Image.Resampling was added in Pillow 9.1, older versions only have the module level constant.
+            resample = getattr(Image, "Resampling", Image).LANCZOS
+
+            with Image.open(main_icon_path) as orig_img:
+                for dirname, icon_path in icon_paths.items():
+                    size = int(icon_sizes[dirname])
+                    # A PNG icon that already has the density's size doesn't need to be re-encoded.
+                    if orig_img.format == "PNG" and orig_img.size == (size, size):
+                        shutil.copyfile(main_icon_path, icon_path)
+                    else:
+                        orig_img.resize((size, size), resample=resample).save(icon_path)
 
-            main_icon_path = ""
+    elif icon_base_url_alt is not None:
+        if store_name == "Play_Store":
+            download_icons(icon_downloads=[(dirname,
+                                            icon_base_url_alt + icon_sizes[dirname] + "-h" + icon_sizes[dirname],
+                                            icon_path)
+                                           for dirname, icon_path in icon_paths.items()])
 
-            for dirname in data_file_content["Icon_Relations"].keys():
 
-                icon_path = os.path.join(repo_dir, dirname, filename)
+def get_missing_icon_paths(repo_dir: str,
+                           filename: str,
+                           force_icons: bool,
+                           data_file_content: dict) -> Dict[str, str]:
+    # Icon path for each density directory that still needs an icon, all of them when forced.
+    icon_paths = {}  # type: Dict[str, str]
 
-                if os.path.exists(icon_path) and not force_icons:
-                    continue
+    for dirname in data_file_content["Icon_Relations"].keys():
+        icon_path = os.path.join(repo_dir, dirname, filename)
 
-                if main_icon_path == "":
-                    tmp_dir = tempfile.mkdtemp()
-                    try:
-                        urllib.request.urlretrieve(icon_base_url, os.path.join(tmp_dir, filename))
-                        main_icon_path = os.path.join(tmp_dir, filename)
-                    except urllib.error.HTTPError:
-                        print(Fore.YELLOW + "\tCouldn't download icon for {}.".format(dirname))
-                        return
-                    except PermissionError:
-                        print(Fore.YELLOW + "\tCouldn't write icon file for {}. Permission denied.".format(dirname))
-                        return
-
-                orig_img = Image.open(main_icon_path)
-                resized_img = orig_img.resize((int(data_file_content["Icon_Relations"][dirname]),
-                                               int(data_file_content["Icon_Relations"][dirname])))
-                resized_img.save(icon_path)
-                orig_img.close()
+        if force_icons or not os.path.exists(icon_path):
+            icon_paths[dirname] = icon_path
 
-    elif icon_base_url_alt is not None:
-        if store_name == "Play_Store":
-            for dirname in data_file_content["Icon_Relations"].keys():
-                icon_path = os.path.join(repo_dir, dirname, filename)
+    return icon_paths
 
-                if os.path.exists(icon_path) and not force_icons:
-                    continue
 
-                url = (icon_base_url_alt + data_file_content["Icon_Relations"][dirname] + "-h" +
-                       data_file_content["Icon_Relations"][dirname])  # type: str
+def download_icons(icon_downloads: List[Tuple[str, str, str]]) -> None:
+    # Every density is a separate request, (dirname, url, icon_path) entries are downloaded at the same time.
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        futures = [executor.submit(download_file, url=url, file_path=icon_path)
+                   for _, url, icon_path in icon_downloads]
 
-                try:
-                    urllib.request.urlretrieve(url, icon_path)
-                except urllib.error.HTTPError:
-                    print(Fore.YELLOW + "\tCouldn't download icon for {}.".format(dirname))
-                except PermissionError:
-                    print(Fore.YELLOW + "\tCouldn't write icon file for {}. Permission denied.".format(dirname))
+    for future, (dirname, _, _) in zip(futures, icon_downloads):
+        try:
+            future.result()
+        except requests.RequestException:
+            print(Fore.YELLOW + "\tCouldn't download icon for {}.".format(dirname))
+        except PermissionError:
+            print(Fore.YELLOW + "\tCouldn't write icon file for {}. Permission denied.".format(dirname))
 
 
 def sanitize_lang(lang: str) -> str:
     lang = lang.strip().lower()
+    return LANGUAGE_ALIASES.get(lang, lang)
 
-    if lang == "es":
-        lang = "es-Es"
-    elif lang == "419":
-        lang = "es-419"
-    elif lang == "en":
-        lang = "en-US"
-    elif lang == "us":
-        lang = "en-US"
-    elif lang == "pt":
-        lang = "pt-PT"
-    elif lang == "fr":
-        lang = "fr-FR"
-    elif lang == "zh":
-        lang = "zh-CN"
-    elif lang == "br":
-        lang = "pt-BR"
-    elif lang == "gb":
-        lang = "en-GB"
-    elif lang == "ca":
-        lang = "fr-CA"
-    elif lang == "hk":
-        lang = "zh-HK"
-    elif lang == "tw":
-        lang = "zh-TW"
-
-    return lang
+
+def needs_value(package_content: dict,
+                field_name: str,
+                force: bool,
+                unset_values: tuple = (None, "")) -> bool:
+    # A field is filled in when it's forced or still holds one of the values that count as not set.
+    return force or package_content.get(field_name) in unset_values
 
 
 def is_metadata_complete(package_content: dict) -> bool:
-    if (package_content.get("AuthorName") is None
-            or package_content.get("WebSite") is None
-            or package_content.get("Categories") is None
-            or package_content.get("Name") is None
-            or package_content.get("Summary") is None
-            or package_content.get("Description") is None
-            or package_content.get("AuthorEmail") is None
-            or package_content.get("AntiFeatures") is None
-            or package_content.get("CurrentVersionCode") is None
-            or package_content.get("CurrentVersion") is None
-            or package_content.get("License") is None):
-        return False
+    for field_name, invalid_values in REQUIRED_METADATA_FIELDS:
+        if package_content.get(field_name) in invalid_values:
+            return False
 
-    if (package_content.get("AuthorName", "") != ""
-            and package_content.get("WebSite", "") != ""
-            and package_content.get("Categories", "") != ""
-            and package_content.get("Categories", "") != ["fdroid_repo"]
-            and package_content.get("Name", "") != ""
-            and package_content.get("Summary", "") != ""
-            and package_content.get("Description", "") != ""
-            and package_content.get("AuthorEmail", "") != ""
-            and package_content.get("AntiFeatures", "") != ""
-            and package_content.get("CurrentVersionCode", "") != ""
-            and package_content.get("CurrentVersionCode", "") != 0
-            and package_content.get("CurrentVersionCode", "") != 2147483647
-            and package_content.get("CurrentVersion", "") != ""
-            and package_content.get("CurrentVersion", "") != "0"
-            and package_content.get("License", "") != ""
-            and package_content.get("License", "") != "Unknown"):
-        return True
-    else:
-        return False
+    return True
 
 
 def is_icon_complete(package: str,
@@ -1732,34 +2109,24 @@ def is_icon_complete(package: str,
 
     filename = package + "." + str(version_code) + ".png"
 
-    icon_relations = {}
-
-    for key in data_file_content["Icon_Relations"].keys():
-        icon_relations[key] = False
-
-    for dirname in icon_relations.keys():
-        icon_path = os.path.join(repo_dir, dirname, filename)
-        if os.path.exists(icon_path):
-            icon_relations[dirname] = True
-
-    if all(icon_relations.values()):
-        return True
-    else:
-        return False
+    # Stops at the first missing density.
+    return all(os.path.exists(os.path.join(repo_dir, dirname, filename))
+               for dirname in data_file_content["Icon_Relations"])
 
 
 def screenshot_exist(package: str,
                      repo_dir: str) -> bool:
     screenshots_path = os.path.join(repo_dir, package, "en-US", "phoneScreenshots")
 
-    if not os.path.exists(screenshots_path):
-        return False
-
-    for item in os.listdir(screenshots_path):
-        if item.lower().endswith((".png", ".jpg", ".jpeg")):
-            return True
-        if item.lower() == ".noscreenshots":
-            return True
+    # Stops at the first screenshot or marker file instead of listing the whole directory.
+    try:
+        with os.scandir(screenshots_path) as dir_entries:
+            for entry in dir_entries:
+                item = entry.name.lower()
+                if item == ".noscreenshots" or item.endswith(SCREENSHOT_EXTENSIONS):
+                    return True
+    except (FileNotFoundError, NotADirectoryError):
+        pass
 
     return False
 
@@ -1768,14 +2135,9 @@ def write_yml(metadata_dir: str,
               package: str,
               package_content: dict) -> bool:
     try:
-        stream = open(os.path.join(metadata_dir, package + ".yml"), "w", encoding="utf_8")
-
-        yaml = ruamel.yaml.YAML()
-        yaml.indent(mapping=2, sequence=4, offset=2)
-        ruamel.yaml.scalarstring.walk_tree(package_content)
-        yaml.dump(package_content, stream)
-
-        stream.close()
+        with open(os.path.join(metadata_dir, package + ".yml"), "w", encoding="utf_8") as stream:
+            ruamel.yaml.scalarstring.walk_tree(package_content)
+            get_yml_dumper().dump(package_content, stream)
 
         return True
     except PermissionError:
@@ -1783,100 +2145,115 @@ def write_yml(metadata_dir: str,
         return False
 
 
-def load_yml(metadata_dir: str,
-             package: str) -> Optional[Dict]:
-    if os.path.exists(os.path.join(metadata_dir, package + ".yml")):
-        try:
-            stream = open(os.path.join(metadata_dir, package + ".yml"), "r", encoding="utf_8")
+@functools.lru_cache(maxsize=None)
+def get_yml_dumper() -> ruamel.yaml.YAML:
+    # Configured once and reused for every package, the round-trip dumper keeps the layout of F-Droid's metadata files.
+    yaml = ruamel.yaml.YAML()
+    yaml.indent(mapping=2, sequence=4, offset=2)
+    return yaml
 
-            yaml = ruamel.yaml.YAML(typ="safe")
-            package_content = yaml.load(stream)  # type:Dict
 
-            stream.close()
+@functools.lru_cache(maxsize=None)
+def get_yml_loader() -> ruamel.yaml.YAML:
+    # The safe loader uses libyaml's C parser when ruamel.yaml.clib is installed, set up once for every package.
+    return ruamel.yaml.YAML(typ="safe")
 
-            if package_content is None:
-                return {}
-            else:
-                return package_content
-        except PermissionError:
-            print(Fore.YELLOW + "\tWARNING: Couldn't read metadata file. Permission denied, skipping package...",
-                  end="\n\n")
-            return None
-    else:
+
+def load_yml(metadata_dir: str,
+             package: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(metadata_dir, package + ".yml"), "r", encoding="utf_8") as stream:
+            package_content = get_yml_loader().load(stream.read())  # type:Dict
+    except FileNotFoundError:
         return {}
+    except PermissionError:
+        print(Fore.YELLOW + "\tWARNING: Couldn't read metadata file. Permission denied, skipping package...",
+              end="\n\n")
+        return None
+
+    if package_content is None:
+        return {}
+    else:
+        return package_content
 
 
 def write_not_found_log(items: list,
                         file_name: str,
-                        log_path: str) -> None:
-    today_date = datetime.today().strftime("%Y%m%d_%H%M%S")
+                        log_path: str,
+                        today_date: str) -> None:
     file_name = os.path.join(log_path, file_name + "_" + today_date + ".log")
 
     try:
-        log_stream = open(file_name, "w")
-    except IOError as e:
-        print(Fore.RED + e)
-        return
-
-    for item in items:
-        try:
-            log_stream.write(item + "\n")
-        except IOError as e:
-            print(Fore.RED + e)
-            return
+        with open(file_name, "w", encoding="utf_8") as log_stream:
+            log_stream.write("\n".join(items) + "\n")
+    except OSError as e:
+        print(Fore.RED + str(e))
 
 
 def get_amazon_page(resp_list: list,
+                    messages: List[str],
                     language: str,
                     new_package: str,
                     cookie_path: Optional[str]) -> bool:
 
     if cookie_path is None:
-        print(Fore.YELLOW + "\tCookie file was not specified. Amazon Appstore page download will not be performed.",
-              end="\n\n")
+        messages.append(Fore.YELLOW + "\tCookie file was not specified. "
+                                      "Amazon Appstore page download will not be performed.")
         return False
 
-    cookie_jar = MozillaCookieJar(cookie_path)
+    cookie_jar = load_cookie_jar(cookie_path=cookie_path)
     url = "https://www.amazon.com/gp/mas/dl/android?p=" + new_package
 
-    alt_language = re.sub(r"-.+", "", language)
+    alt_language = LANGUAGE_REGION_PATTERN.sub("", language)
 
-    sess = requests.Session()
-    sess.cookies = cookie_jar
-    sess.cookies.load()
-
-    sess.headers = {
+    headers = {
         "User-Agent": USER_AGENT,
         "Accept-Language": language + "," + alt_language
     }
 
-    resp = sess.get(url, allow_redirects=True)
-
-    if resp.url.find("https://www.amazon.com/gp/browse.html") != -1:
-        print(Fore.YELLOW + "\t{} was not found on the Amazon Appstore.".format(new_package), end="\n\n")
-        return False
-
-    resp = resp.content.decode(encoding="utf_8", errors="replace")
-
-    if "<p class=\"a-last\">Sorry, we just need to make sure you're not a robot." in resp:
-        print(Fore.RED + "\tERROR: Cookie file doesn't contain Amazon cookies.", end="\n\n")
-        return False
-
+    # Both variants are independent, the en-US page is downloaded in the background while the localized one is.
     if language == "en-US":
-        resp_int = resp
+        resp_int_future = None
     else:
-        sess.headers = {
-            "User-Agent": USER_AGENT,
-            "Accept-Language": "en-US,en"
-        }
+        resp_int_future = BACKGROUND_DOWNLOADS.submit(download_store_page,
+                                                      url=url,
+                                                      headers={"User-Agent": USER_AGENT, "Accept-Language": "en-US,en"},
+                                                      cookies=cookie_jar)
+
+    try:
+        try:
+            resp_url, resp = download_store_page(url=url,
+                                                 headers=headers,
+                                                 cookies=cookie_jar)
+        except requests.RequestException:
+            messages.append(Fore.YELLOW + "\tCouldn't download the Amazon Appstore page for {}.".format(new_package))
+            return False
 
-        resp_int = sess.get(url, allow_redirects=True)
+        if resp_url.find("https://www.amazon.com/gp/browse.html") != -1:
+            messages.append(Fore.YELLOW + "\t{} was not found on the Amazon Appstore.".format(new_package))
+            return False
 
-        if resp_int.url.find("https://www.amazon.com/gp/browse.html") != -1:
-            print(Fore.YELLOW + "\t{} was not found on the Amazon Appstore (INT).".format(new_package), end="\n\n")
+        if "<p class=\"a-last\">Sorry, we just need to make sure you're not a robot." in resp:
+            messages.append(Fore.RED + "\tERROR: Cookie file doesn't contain Amazon cookies.")
             return False
 
-        resp_int = resp_int.content.decode(encoding="utf_8", errors="replace")
+        if resp_int_future is None:
+            resp_int = resp
+        else:
+            try:
+                resp_int_url, resp_int = resp_int_future.result()
+            except requests.RequestException:
+                messages.append(Fore.YELLOW + "\tCouldn't download the Amazon Appstore page for {} (INT).".format(
+                    new_package))
+                return False
+
+            if resp_int_url.find("https://www.amazon.com/gp/browse.html") != -1:
+                messages.append(Fore.YELLOW + "\t{} was not found on the Amazon Appstore (INT).".format(new_package))
+                return False
+    finally:
+        # An early return doesn't wait for the background download, it's dropped if it hasn't started yet.
+        if resp_int_future is not None:
+            resp_int_future.cancel()
 
     resp_list.append(resp)
     resp_list.append(resp_int)
@@ -1884,48 +2261,83 @@ def get_amazon_page(resp_list: list,
     return True
 
 
+def download_store_page(url: str,
+                        headers: Dict[str, str],
+                        cookies: Optional[MozillaCookieJar] = None) -> Tuple[str, str]:
+    # Returns the final URL after redirects and the page, used for the Amazon Appstore and Apkcombo pages.
+    with http_session() as session, session.get(url,
+                                                headers=headers,
+                                                cookies=cookies,
+                                                allow_redirects=True,
+                                                timeout=REQUEST_TIMEOUT) as response:
+        return response.url, response.content.decode(encoding="utf_8", errors="replace")
+
+
+@functools.lru_cache(maxsize=None)
+def load_cookie_jar(cookie_path: str) -> MozillaCookieJar:
+    # The cookie file is parsed once and shared by every Amazon Appstore request.
+    cookie_jar = MozillaCookieJar(cookie_path)
+    cookie_jar.load()
+    return cookie_jar
+
+
 def get_apkcombo_page(resp_list: list,
+                      messages: List[str],
                       language: str,
                       new_package: str,
                       data_file_content: dict) -> bool:
 
     url_int = "https://apkcombo.com/xxxx/" + new_package
 
-    alt_language = re.sub(r"-.+", "", language)
+    alt_language = LANGUAGE_REGION_PATTERN.sub("", language)
     new_language = sanitize_lang_apkcombo(language=alt_language,
-                                          data_file_content=data_file_content)
+                                          data_file_content=data_file_content,
+                                          messages=messages)
 
     url = "https://apkcombo.com/" + new_language + "/xxxx/" + new_package
 
-    sess = requests.Session()
-
-    sess.headers = {
+    headers = {
         "User-Agent": USER_AGENT,
         "Accept-Language": language + "," + alt_language
     }
 
-    resp = sess.get(url, allow_redirects=True)
-    resp = resp.content.decode(encoding="utf_8", errors="replace")
-
-    if resp.find("We're sorry, the app was not found on APKCombo.") != -1:
-        print(Fore.YELLOW + "\t{} was not found on Apkcombo.".format(new_package), end="\n\n")
-        return False
-
+    # Both variants are independent, the English page is downloaded in the background while the localized one is.
     if new_language == "en":
-        resp_int = resp
+        resp_int_future = None
     else:
-        sess.headers = {
-            "User-Agent": USER_AGENT,
-            "Accept-Language": "en-US,en"
-        }
+        resp_int_future = BACKGROUND_DOWNLOADS.submit(download_store_page,
+                                                      url=url_int,
+                                                      headers={"User-Agent": USER_AGENT, "Accept-Language": "en-US,en"})
 
-        resp_int = sess.get(url_int, allow_redirects=True)
-        resp_int = resp_int.content.decode(encoding="utf_8", errors="replace")
+    try:
+        try:
+            resp = download_store_page(url=url,
+                                       headers=headers)[1]
+        except requests.RequestException:
+            messages.append(Fore.YELLOW + "\tCouldn't download the Apkcombo page for {}.".format(new_package))
+            return False
 
-        if resp_int.find("We're sorry, the app was not found on APKCombo.") != -1:
-            print(Fore.YELLOW + "\t{} was not found on Apkcombo.".format(new_package), end="\n\n")
+        if resp.find("We're sorry, the app was not found on APKCombo.") != -1:
+            messages.append(Fore.YELLOW + "\t{} was not found on Apkcombo.".format(new_package))
             return False
 
+        if resp_int_future is None:
+            resp_int = resp
+        else:
+            try:
+                resp_int = resp_int_future.result()[1]
+            except requests.RequestException:
+                messages.append(Fore.YELLOW + "\tCouldn't download the Apkcombo page for {} (INT).".format(new_package))
+                return False
+
+            if resp_int.find("We're sorry, the app was not found on APKCombo.") != -1:
+                messages.append(Fore.YELLOW + "\t{} was not found on Apkcombo.".format(new_package))
+                return False
+    finally:
+        # An early return doesn't wait for the background download, it's dropped if it hasn't started yet.
+        if resp_int_future is not None:
+            resp_int_future.cancel()
+
     resp_list.append(resp)
     resp_list.append(resp_int)
 
@@ -1933,12 +2345,13 @@ def get_apkcombo_page(resp_list: list,
 
 
 def sanitize_lang_apkcombo(language: str,
-                           data_file_content: dict) -> str:
+                           data_file_content: dict,
+                           messages: List[str]) -> str:
     if language == "in":
         language = "id"
 
     if language not in data_file_content["Locales"]["Apkcombo_Store"]:
-        print(Fore.YELLOW + "\tThe language {} is not available in Apkcombo, English will be used instead.".
+        messages.append(Fore.YELLOW + "\tThe language {} is not available in Apkcombo, English will be used instead.".
               format(language))
         language = "en"
 
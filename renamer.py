@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import argparse
 import copy
+import functools
 import json
 import os
 import platform
@@ -37,6 +38,11 @@ PACKAGE_DENSITIES = "Densities"
 PACKAGE_LOCALES = "Locales"
 PACKAGE_LABEL = "Label"
 
+PACKAGE_NAME_PATTERN = re.compile(r"(?:^|\s)name='([^']*)'")
+PACKAGE_VERSION_CODE_PATTERN = re.compile(r"(?:^|\s)versionCode='([^']*)'")
+PACKAGE_VERSION_NAME_PATTERN = re.compile(r"(?:^|\s)versionName='([^']*)'")
+PACKAGE_COMPILE_SDK_PATTERN = re.compile(r"(?:^|\s)compileSdkVersion='([^']*)'")
+
 
 def main():
     parser = argparse.ArgumentParser(formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -162,11 +168,11 @@ def main():
     sign_apk = args.sign_apk  # type: bool
 
     if build_tools_path is None:
-        if shutil.which("aapt") is None:
+        if find_tool(tool_name="aapt") is None:
             print(Fore.RED + "ERROR: Could not find aapt executable in PATH. Please install it.")
             exit(1)
 
-        if shutil.which("aapt2") is None:
+        if find_tool(tool_name="aapt2") is None:
             print("Could not find aapt2 executable in PATH. Please install it.")
             exit(1)
     else:
@@ -184,7 +190,7 @@ def main():
         exit(1)
 
     if convert_apks:
-        if shutil.which("java") is None:
+        if find_tool(tool_name="java") is None:
             print(Fore.RED + "ERROR: Java not found in PATH, can't convert .apks files to .apk.")
             exit(1)
 
@@ -196,7 +202,7 @@ def main():
             exit(1)
 
     if sign_apk:
-        if build_tools_path is None and shutil.which("apksigner") is None:
+        if build_tools_path is None and find_tool(tool_name="apksigner") is None:
             print(Fore.RED + "ERROR:Please install the build-tools package of the Android SDK if you want to convert "
                              "APKS files.")
             print(Fore.RED + "Apksigner not found.")
@@ -214,8 +220,7 @@ def main():
                 print(Fore.RED + "ERROR: Invalid cert file path.")
                 exit(1)
 
-    if (os.path.isfile(item_path) and os.path.splitext(item_path)[1].lower() != APK_EXTENSION
-            and os.path.splitext(item_path)[1].lower() != APKS_EXTENSION):
+    if os.path.isfile(item_path) and not item_path.lower().endswith((APK_EXTENSION, APKS_EXTENSION)):
         print(Fore.RED + "ERROR: Supplied path is not an APK or APKS file.")
         exit(1)
 
@@ -347,8 +352,7 @@ def process_file(item_path: str,
     if os.path.isdir(item_path):
         return
 
-    if (os.path.splitext(item_path)[1].lower() != APK_EXTENSION and
-            os.path.splitext(item_path)[1].lower() != APKS_EXTENSION):
+    if not item_path.lower().endswith((APK_EXTENSION, APKS_EXTENSION)):
         return
 
     apk_info = get_info(app_file_path=item_path,
@@ -594,6 +598,12 @@ def join_values(list_values: list) -> str:
     return new_name
 
 
+@functools.lru_cache(maxsize=None)
+def find_tool(tool_name: str) -> Optional[str]:
+    # PATH is searched once per tool, badging runs for every APK file.
+    return shutil.which(tool_name)
+
+
 def get_program_dir() -> str:
     if getattr(sys, "frozen", False):
         return os.path.dirname(sys.executable)
@@ -723,12 +733,12 @@ def badging(app_file_path: str,
 
     # TODO: Add option to look in the ANDROID_HOME ENV VAR
 
-    aapt_bin_path = shutil.which("aapt")
-    aapt2_bin_path = shutil.which("aapt2")
-
     if build_tools_path is not None:
-        aapt_bin_path = os.path.join(build_tools_path[0], "aapt")
-        aapt2_bin_path = os.path.join(build_tools_path[0], "aapt2")
+        aapt_bin_path = os.path.join(build_tools_path, "aapt")
+        aapt2_bin_path = os.path.join(build_tools_path, "aapt2")
+    else:
+        aapt_bin_path = find_tool(tool_name="aapt")
+        aapt2_bin_path = find_tool(tool_name="aapt2")
 
     orig_badging_command = [aapt_bin_path,
                             "d",
@@ -921,21 +931,21 @@ def convert_to_apk(apks_file: str,
 
     print(Fore.GREEN + "\tConverting {} to .APK...".format(os.path.basename(apks_file)), end="\n\n")
 
-    convert_command_orig = ["java",
-                            "-jar",
-                            apk_editor_path,
-                            "m",
-                            "-i",
-                            "",
-                            "-o",
-                            "",
-                            "-f"]
-
     if sign_apk:
         apk_path_unsigned = os.path.splitext(apks_file)[0] + "_unsigned.apk"
     else:
         apk_path_unsigned = os.path.splitext(apks_file)[0] + APK_EXTENSION
 
+    convert_command = ["java",
+                       "-jar",
+                       apk_editor_path,
+                       "m",
+                       "-i",
+                       apks_file,
+                       "-o",
+                       apk_path_unsigned,
+                       "-f"]
+
     try:
         old_app_stats = os.lstat(apks_file)
     except PermissionError:
@@ -944,10 +954,7 @@ def convert_to_apk(apks_file: str,
         old_app_stats = None
 
     try:
-        convert_command = copy.deepcopy(convert_command_orig)
-        convert_command[5] = apks_file
-        convert_command[7] = apk_path_unsigned
-        subprocess.run(convert_command, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        subprocess.run(convert_command, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, check=True)
     except subprocess.CalledProcessError as e:
         print(Fore.RED + "\tERROR: There was an error converting {} to .apk".format(os.path.basename(apks_file)),
               end="\n\n")
@@ -1017,46 +1024,30 @@ def sign_apk_file(key_file: str,
     """
 
     if build_tools_path is not None:
-        apksigner_path = os.path.join(build_tools_path[0], "apksigner")
-    else:
-        apksigner_path = shutil.which("apksigner")
-
-    if certificate_password is not None:
-        sign_command_orig = [apksigner_path,
-                             "sign",
-                             "--key",
-                             key_file,
-                             "--cert",
-                             cert_file,
-                             "--key-pass",
-                             "pass:" + certificate_password,
-                             "--in",
-                             "",
-                             "--out",
-                             ""]
+        apksigner_path = os.path.join(build_tools_path, "apksigner")
     else:
-        sign_command_orig = [apksigner_path,
-                             "sign",
-                             "--key",
-                             key_file,
-                             "--cert",
-                             cert_file,
-                             "--key-pass",
-                             "pass:",
-                             "--in",
-                             "",
-                             "--out",
-                             ""]
-
-    sign_command = copy.deepcopy(sign_command_orig)
-    sign_command[9] = apk_path_unsigned
-    sign_command[11] = apk_path_signed
+        apksigner_path = find_tool(tool_name="apksigner")
+
+    if certificate_password is None:
+        certificate_password = ""
+
+    sign_command = [apksigner_path,
+                    "sign",
+                    "--key",
+                    key_file,
+                    "--cert",
+                    cert_file,
+                    "--key-pass",
+                    "pass:" + certificate_password,
+                    "--in",
+                    apk_path_unsigned,
+                    "--out",
+                    apk_path_signed]
 
     try:
-        subprocess.run(sign_command, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        subprocess.run(sign_command, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, check=True)
     except subprocess.CalledProcessError as e:
-        print(Fore.RED + "\tERROR: There was an error signing {}, aborting conversion...",
-              format(apk_path_unsigned),
+        print(Fore.RED + "\tERROR: There was an error signing {}, aborting conversion...".format(apk_path_unsigned),
               end="\n\n")
         print(e, end="\n\n")
         return False
@@ -1102,22 +1093,22 @@ def get_package_info(apk_info: dict,
                      value: str) -> None:
     if apk_info.get(PACKAGE_NAME, "") == "":
         try:
-            apk_info[PACKAGE_NAME] = re.search(r"(?:^|\s)name='([^']*)'", value).group(1)
+            apk_info[PACKAGE_NAME] = PACKAGE_NAME_PATTERN.search(value).group(1)
         except (AttributeError, IndexError):
             pass
     if apk_info.get(PACKAGE_VERSION_CODE, "") == "":
         try:
-            apk_info[PACKAGE_VERSION_CODE] = re.search(r"(?:^|\s)versionCode='([^']*)'", value).group(1)
+            apk_info[PACKAGE_VERSION_CODE] = PACKAGE_VERSION_CODE_PATTERN.search(value).group(1)
         except (AttributeError, IndexError):
             pass
     if apk_info.get(PACKAGE_VERSION_NAME, "") == "":
         try:
-            apk_info[PACKAGE_VERSION_NAME] = re.search(r"(?:^|\s)versionName='([^']*)'", value).group(1)
+            apk_info[PACKAGE_VERSION_NAME] = PACKAGE_VERSION_NAME_PATTERN.search(value).group(1)
         except (AttributeError, IndexError):
             pass
     if apk_info.get(PACKAGE_COMPILE_SDK, "") == "":
         try:
-            apk_info[PACKAGE_COMPILE_SDK] = re.search(r"(?:^|\s)compileSdkVersion='([^']*)'", value).group(1)
+            apk_info[PACKAGE_COMPILE_SDK] = PACKAGE_COMPILE_SDK_PATTERN.search(value).group(1)
         except (AttributeError, IndexError):
             pass
 